@@ -0,0 +1,67 @@
+"""
+DRF authentication for the Admin Application.
+
+This module resolves the ``jwt`` cookie to an AdminUser once per request,
+using the JWT configuration shared with the student API.
+"""
+
+import logging
+from typing import Any, Dict
+
+from jwt import ExpiredSignatureError, InvalidTokenError
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+
+from api.authentication import JWT_ALGORITHMS, JWT_CODEC, JWT_KEY
+from .models import AdminUser
+
+# Configure logger for this module
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class JWTAdminAuthentication(BaseAuthentication):
+    """
+    Authenticate admins from the ``jwt`` cookie set by LoginView.
+
+    Requests without the cookie are left anonymous; a present but
+    invalid, expired or orphaned token fails authentication. On success
+    ``request.user`` is the AdminUser (permission caches primed) and
+    ``request.auth`` is the decoded token payload.
+    """
+
+    def authenticate(self, request) -> tuple[AdminUser, Dict[str, Any]] | None:
+        """
+        Resolve the request's JWT cookie to an admin user.
+
+        Args:
+            request: The DRF request.
+
+        Returns:
+            (user, payload) for a valid token, or None without a cookie.
+
+        Raises:
+            AuthenticationFailed: If the token is invalid, expired, or
+                names a user that no longer exists.
+        """
+        token: str | None = request.COOKIES.get('jwt')
+        if not token:
+            return None
+
+        try:
+            payload: Dict[str, Any] = JWT_CODEC.decode(token, JWT_KEY, algorithms=JWT_ALGORITHMS)
+        except ExpiredSignatureError:
+            logger.warning("Admin JWT token expired")
+            raise AuthenticationFailed('Unauthenticated')
+        except InvalidTokenError:
+            logger.warning("Admin JWT token invalid")
+            raise AuthenticationFailed('Unauthenticated')
+
+        try:
+            user: AdminUser = AdminUser.with_permissions.only(
+                'id', 'name', 'username'
+            ).get(id=payload['id'])
+        except AdminUser.DoesNotExist:
+            logger.warning(f"Admin JWT token for missing user: id={payload['id']}")
+            raise AuthenticationFailed('Unauthenticated')
+        user.prime_permission_cache()
+        return (user, payload)
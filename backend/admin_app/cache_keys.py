@@ -0,0 +1,40 @@
+"""
+Cache keys and timeouts for the Admin Application.
+
+Kept free of imports so views, signals, tasks and management commands
+can share the keys without loading each other.
+"""
+
+# Serialized UserView payload per JWT, keyed by a digest of the token;
+# entries never outlive the token and LogoutView deletes them
+ADMIN_USER_CACHE_PREFIX: str = 'admin_app:user:'
+ADMIN_USER_CACHE_TIMEOUT: int = 300
+
+# Cached ClassListView payload; admin_app.signals deletes it on writes
+CLASS_LIST_CACHE_KEY: str = 'admin_app:class-list'
+CLASS_LIST_CACHE_TIMEOUT: int = 60
+
+# Cached dashboard counts; admin_app.signals deletes them on create/delete
+CLASS_COUNT_CACHE_KEY: str = 'admin_app:count:class'
+STUDENT_COUNT_CACHE_KEY: str = 'admin_app:count:student'
+COUNT_CACHE_TIMEOUT: int = 30
+
+# Cached AttendanceTrendView aggregate. It works like a materialized view:
+# the refresh_attendance_trend beat task rebuilds it every 30s and writes do
+# not drop it, so busy marking periods never force a full-table scan
+ATTENDANCE_TREND_CACHE_KEY: str = 'admin_app:attendance-trend'
+ATTENDANCE_TREND_CACHE_TIMEOUT: int = 60
+
+# Cached DetailedAttendanceReportView payloads per (class, date range). Keys
+# embed a generation token that admin_app.signals deletes whenever a class,
+# student or attendance row changes, retiring every cached report at once
+REPORT_GENERATION_CACHE_KEY: str = 'admin_app:report-generation'
+REPORT_CACHE_PREFIX: str = 'admin_app:report:'
+REPORT_CACHE_TIMEOUT: int = 60
+
+# Current ETag of each conditional list endpoint; admin_app.signals deletes
+# them on writes so the next GET mints a fresh tag
+CLASS_LIST_ETAG_CACHE_KEY: str = 'admin_app:etag:class-list'
+STUDENT_LIST_ETAG_CACHE_KEY: str = 'admin_app:etag:student-list'
+ATTENDANCE_LIST_ETAG_CACHE_KEY: str = 'admin_app:etag:attendance-list'
+LIST_ETAG_CACHE_TIMEOUT: int = 300
@@ -1,8 +1,21 @@
-from django.contrib.auth.models import AbstractUser, Group, Permission
+from django.contrib.auth.models import AbstractUser, Group, Permission, UserManager
 from django.db import models
+from django.db.models import Prefetch
+
+
+class AdminUserPermissionManager(models.Manager):
+    """Manager that eagerly loads the permission M2M relations of admin users."""
+
+    def get_queryset(self) -> models.QuerySet:
+        permissions = Permission.objects.select_related('content_type')
+        return super().get_queryset().prefetch_related(
+            Prefetch('user_permissions', queryset=permissions),
+            Prefetch('groups__permissions', queryset=permissions),
+        )
 
 
 class AdminUser(AbstractUser):
+    """Admin dashboard account with its own group and permission relations."""
     name = models.CharField(max_length=100)
     username = models.CharField(max_length=100, unique=True)
     password = models.CharField(max_length=100)
@@ -22,5 +35,31 @@ class AdminUser(AbstractUser):
         verbose_name='user permissions',
     )
 
+    objects = UserManager()
+    with_permissions = AdminUserPermissionManager()
+
     REQUIRED_FIELDS = []
+
+    def prime_permission_cache(self) -> None:
+        """
+        Fill Django's per-instance permission caches from prefetched relations.
+
+        ``ModelBackend`` stores resolved permissions in ``_user_perm_cache``,
+        ``_group_perm_cache`` and ``_perm_cache`` and only queries the
+        database when they are missing. Instances loaded through
+        ``AdminUser.with_permissions`` already hold the permissions in memory,
+        so later ``has_perm`` checks on them need no further queries.
+        """
+        user_perms = {
+            f"{perm.content_type.app_label}.{perm.codename}"
+            for perm in self.user_permissions.all()
+        }
+        group_perms = {
+            f"{perm.content_type.app_label}.{perm.codename}"
+            for group in self.groups.all()
+            for perm in group.permissions.all()
+        }
+        self._user_perm_cache = user_perms
+        self._group_perm_cache = group_perms
+        self._perm_cache = user_perms | group_perms
     
\ No newline at end of file
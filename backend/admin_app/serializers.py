@@ -6,15 +6,238 @@ validation, and comprehensive error handling following professional
 coding practices.
 """
 
-from typing import Dict, Any, TypeVar, Type
+import os
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional, TypeVar, Type
 from rest_framework import serializers
-from django.contrib.auth.hashers import make_password
+from django.core.exceptions import FieldDoesNotExist
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import QuerySet, Value
+from django.db.models.functions import Coalesce, Concat, Trim
+from api.hashers import TunedArgon2PasswordHasher
 from api.models import User, Role, Admin, Class, Student, Attendance
+from api.serializers import (
+    CLASS_YEAR_MSG,
+    MAX_CLASS_YEAR,
+    MIN_CLASS_YEAR,
+    VALID_STATUSES,
+    VALID_STATUSES_MSG,
+    RoleSerializer,
+    require_nonempty,
+)
 from .models import AdminUser
 
 # Type variables for generic serialization
 T = TypeVar('T')
 
+# Rows per INSERT statement for bulk creation
+BULK_BATCH_SIZE: int = 1000
+
+# Hasher resolved once at import instead of per make_password() call
+_HASHER: TunedArgon2PasswordHasher = TunedArgon2PasswordHasher()
+
+# Most worker threads per bulk hash. Argon2 releases the GIL, but each hash
+# already runs `parallelism` lanes over memory_cost KiB, so one thread per
+# `parallelism` cores, and at most 4 (256 MiB with the tuned hasher)
+MAX_HASH_WORKERS: int = max(1, min(4, (os.cpu_count() or 1) // _HASHER.parallelism))
+
+
+def hash_password(password: str) -> str:
+    """
+    Hash a raw password with the module-level Argon2 hasher.
+    
+    Args:
+        password: The raw password.
+        
+    Returns:
+        The encoded password hash.
+    """
+    return _HASHER.encode(password, _HASHER.salt())
+
+
+def hash_passwords_parallel(passwords: List[str]) -> List[str]:
+    """
+    Hash many raw passwords concurrently on a short-lived thread pool.
+    
+    The pool exists only for the duration of the call, so idle web
+    workers hold no hashing threads.
+    
+    Args:
+        passwords: Raw passwords to hash.
+        
+    Returns:
+        The encoded hashes, in the same order as the input.
+    """
+    if len(passwords) < 2:
+        return [hash_password(password) for password in passwords]
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_HASH_WORKERS, len(passwords)),
+        thread_name_prefix='password-hash'
+    ) as pool:
+        return list(pool.map(hash_password, passwords))
+
+
+# "First Middle Last" for an attendance row's student, built in SQL
+STUDENT_NAME_EXPRESSION: Trim = Trim(Concat(
+    'student__first_name', Value(' '),
+    Coalesce('student__middle_name', Value('')), Value(' '),
+    'student__last_name'
+))
+
+
+class RelatedSummaryField(serializers.Field):
+    """
+    Read-only field that renders a few attributes of a related object as a dict.
+    
+    A lighter stand-in for a nested read-only serializer: it produces the
+    same {attr: value} mapping without dispatching through a child
+    serializer's fields for every row.
+    
+    Attributes:
+        attrs: Attribute names to copy from the related object.
+    """
+    
+    def __init__(self, attrs: Iterable[str], **kwargs: Any) -> None:
+        kwargs['read_only'] = True
+        self.attrs: tuple[str, ...] = tuple(attrs)
+        super().__init__(**kwargs)
+
+    def to_representation(self, value: Any) -> Dict[str, Any]:
+        """
+        Copy the configured attributes off the related object.
+        
+        Args:
+            value: The related model instance.
+            
+        Returns:
+            Mapping of attribute name to value.
+        """
+        return {attr: getattr(value, attr) for attr in self.attrs}
+
+
+def _concrete_field_paths(
+    serializer: serializers.ModelSerializer,
+    prefix: str = ''
+) -> List[str]:
+    """
+    Collect the database columns a serializer reads, as ORM lookup paths.
+    
+    Nested model serializers are walked recursively so that their columns
+    are reported relative to the outer model (e.g. ``admin__user__name``).
+    Write-only fields, ``source='*'`` fields and anything that is not a
+    concrete model field are skipped.
+    
+    Args:
+        serializer: The serializer instance to inspect.
+        prefix: Lookup prefix for the serializer's model.
+        
+    Returns:
+        Lookup paths suitable for QuerySet.only().
+    """
+    model = serializer.Meta.model
+    paths: List[str] = []
+    for field in serializer.fields.values():
+        if field.write_only or field.source == '*':
+            continue
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            continue
+        if not model_field.concrete or model_field.many_to_many:
+            continue
+        path: str = f"{prefix}{field.source}"
+        paths.append(path)
+        if isinstance(field, serializers.ModelSerializer):
+            paths.extend(_concrete_field_paths(field, f"{path}__"))
+        elif isinstance(field, RelatedSummaryField):
+            paths.extend(f"{path}__{attr}" for attr in field.attrs)
+    return paths
+
+
+class EagerLoadingSerializerMixin:
+    """
+    Mixin for serializers that render related objects.
+    
+    Each serializer declares the relations it touches so that views can
+    load them up front instead of paying one query per row. Only the
+    columns the serializer actually renders are selected.
+    
+    Attributes:
+        select_related_fields: Forward relations to join into the query.
+        prefetch_related_fields: Reverse or many-to-many relations to prefetch.
+    """
+    
+    select_related_fields: list[str] = []
+    prefetch_related_fields: list[str] = []
+
+    @classmethod
+    def get_only_fields(cls) -> List[str]:
+        """
+        Return the columns rendered by this serializer, computed once per class.
+        
+        Returns:
+            Lookup paths derived from Meta.fields and nested serializers.
+        """
+        if '_only_fields' not in cls.__dict__:
+            cls._only_fields = _concrete_field_paths(cls())
+        return cls._only_fields
+
+    @classmethod
+    def setup_eager_loading(cls, queryset: QuerySet) -> QuerySet:
+        """
+        Apply the declared select/prefetch relations and column list to a queryset.
+        
+        Args:
+            queryset: The queryset to be serialized by this serializer.
+            
+        Returns:
+            The queryset with related objects eagerly loaded.
+        """
+        queryset = queryset.only(*cls.get_only_fields())
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+        return queryset
+
+
+class UserListSerializer(serializers.ListSerializer):
+    """
+    List serializer that rejects a batch repeating a username.
+    
+    Each row's UniqueValidator already rejects usernames that exist in the
+    database; this catches duplicates within the batch itself, which would
+    otherwise only fail at insert time.
+    """
+    
+    def validate(self, attrs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Reject the batch if two rows share a username.
+        
+        Args:
+            attrs: Validated data for each user.
+            
+        Returns:
+            The validated data, unchanged.
+            
+        Raises:
+            serializers.ValidationError: If a username appears more than once.
+        """
+        seen: set[str] = set()
+        duplicates: set[str] = set()
+        for row in attrs:
+            username: str = row['username']
+            if username in seen:
+                duplicates.add(username)
+            seen.add(username)
+        if duplicates:
+            raise serializers.ValidationError(
+                f"Duplicate usernames in request: {', '.join(sorted(duplicates))}"
+            )
+        return attrs
+
 
 class UserSerializer(serializers.ModelSerializer[User]):
     """
@@ -32,10 +255,12 @@ class UserSerializer(serializers.ModelSerializer[User]):
             model: The Django model to serialize
             fields: Fields to include in the serialization
             extra_kwargs: Additional field options (password write-only)
+            list_serializer_class: Serializer used for many=True (bulk register)
         """
         model: Type[User] = User
-        fields: list[str] = ['id', 'name', 'username', 'password']
+        fields: tuple[str, ...] = ('id', 'name', 'username', 'password')
         extra_kwargs: Dict[str, Dict[str, bool]] = {'password': {'write_only': True}}
+        list_serializer_class: Type[serializers.ListSerializer] = UserListSerializer
 
     def create(self, validated_data: Dict[str, Any]) -> User:
         """
@@ -47,7 +272,7 @@ class UserSerializer(serializers.ModelSerializer[User]):
         Returns:
             The created User instance with hashed password.
         """
-        validated_data['password'] = make_password(validated_data['password'])
+        validated_data['password'] = hash_password(validated_data['password'])
         return super().create(validated_data)
 
     def update(self, instance: User, validated_data: Dict[str, Any]) -> User:
@@ -62,7 +287,7 @@ class UserSerializer(serializers.ModelSerializer[User]):
             The updated User instance.
         """
         if 'password' in validated_data:
-            validated_data['password'] = make_password(validated_data['password'])
+            validated_data['password'] = hash_password(validated_data['password'])
         
         return super().update(instance, validated_data)
 
@@ -84,7 +309,7 @@ class AdminUserSerializer(serializers.ModelSerializer[AdminUser]):
             extra_kwargs: Additional field options (password write-only)
         """
         model: Type[AdminUser] = AdminUser
-        fields: list[str] = ['id', 'name', 'username', 'password']
+        fields: tuple[str, ...] = ('id', 'name', 'username', 'password')
         extra_kwargs: Dict[str, Dict[str, bool]] = {'password': {'write_only': True}}
 
     def create(self, validated_data: Dict[str, Any]) -> AdminUser:
@@ -97,7 +322,7 @@ class AdminUserSerializer(serializers.ModelSerializer[AdminUser]):
         Returns:
             The created AdminUser instance with hashed password.
         """
-        validated_data['password'] = make_password(validated_data['password'])
+        validated_data['password'] = hash_password(validated_data['password'])
         return super().create(validated_data)
 
     def update(self, instance: AdminUser, validated_data: Dict[str, Any]) -> AdminUser:
@@ -112,32 +337,32 @@ class AdminUserSerializer(serializers.ModelSerializer[AdminUser]):
             The updated AdminUser instance.
         """
         if 'password' in validated_data:
-            validated_data['password'] = make_password(validated_data['password'])
+            validated_data['password'] = hash_password(validated_data['password'])
         
         return super().update(instance, validated_data)
 
 
-class RoleSerializer(serializers.ModelSerializer[Role]):
+class AdminListSerializer(serializers.ListSerializer):
     """
-    Serializer for the Role model.
+    List serializer that creates admins in bulk.
     
-    Provides serialization and deserialization for role entries
-    with proper type hints and validation.
+    Used automatically when AdminSerializer is instantiated with many=True.
     """
     
-    class Meta:
+    def create(self, validated_data: List[Dict[str, Any]]) -> List[Admin]:
         """
-        Metadata for RoleSerializer.
+        Create all admins via AdminSerializer.create_many.
         
-        Attributes:
-            model: The Django model to serialize
-            fields: Fields to include in the serialization
+        Args:
+            validated_data: Validated data for each admin.
+            
+        Returns:
+            The created Admin instances.
         """
-        model: Type[Role] = Role
-        fields: list[str] = ['id', 'name']
+        return self.child.create_many(validated_data)
 
 
-class AdminSerializer(serializers.ModelSerializer[Admin]):
+class AdminSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer[Admin]):
     """
     Serializer for the Admin model with nested User and Role serializers.
     
@@ -147,6 +372,8 @@ class AdminSerializer(serializers.ModelSerializer[Admin]):
     user: UserSerializer = UserSerializer()
     role: RoleSerializer = RoleSerializer()
 
+    select_related_fields: list[str] = ['user', 'role']
+
     class Meta:
         """
         Metadata for AdminSerializer.
@@ -154,14 +381,20 @@ class AdminSerializer(serializers.ModelSerializer[Admin]):
         Attributes:
             model: The Django model to serialize
             fields: Fields to include in the serialization
+            list_serializer_class: Serializer used for many=True (bulk create)
         """
         model: Type[Admin] = Admin
-        fields: list[str] = ['user', 'role', 'first_name', 'last_name']
+        fields: tuple[str, ...] = ('user', 'role', 'first_name', 'last_name')
+        list_serializer_class: Type[serializers.ListSerializer] = AdminListSerializer
 
     def create(self, validated_data: Dict[str, Any]) -> Admin:
         """
         Create a new admin with nested user and role.
         
+        The password is hashed before the transaction opens so the
+        slow hash does not hold it open; the user, role and admin writes
+        then commit together.
+        
         Args:
             validated_data: Validated data containing admin, user, and role info.
             
@@ -171,22 +404,94 @@ class AdminSerializer(serializers.ModelSerializer[Admin]):
         user_data: Dict[str, Any] = validated_data.pop('user')
         role_data: Dict[str, Any] = validated_data.pop('role')
         
-        user: User = User.objects.create(**user_data)
+        if 'password' in user_data:
+            user_data['password'] = hash_password(user_data['password'])
+        
+        # One commit for all writes; no SAVEPOINT when nested in a request transaction
+        with transaction.atomic(savepoint=False):
+            user: User = User.objects.create(**user_data)
+            
+            role: Role
+            role, _created = Role.objects.get_or_create(name=role_data.get('name', 'Admin'))
+            
+            admin: Admin = Admin.objects.create(
+                user=user,
+                role=role,
+                **validated_data
+            )
+        
+        return admin
+
+    @classmethod
+    def create_many(cls, validated_list: List[Dict[str, Any]]) -> List[Admin]:
+        """
+        Create many admins with a fixed number of queries.
         
-        role_name: str = role_data.get('name', 'Admin')
-        role: Role
-        role, _created = Role.objects.get_or_create(name=role_name)
+        Passwords are hashed up front in parallel, roles are resolved with one lookup
+        (creating any missing ones in a single insert), and users and admins
+        are each written with batched multi-row INSERTs. Relies on the
+        database returning primary keys from bulk_create (PostgreSQL,
+        SQLite 3.35+, MariaDB 10.5+).
         
-        admin: Admin = Admin.objects.create(
-            user=user,
-            role=role,
-            **validated_data
+        Args:
+            validated_list: Validated data for each admin to create.
+            
+        Returns:
+            The created Admin instances.
+        """
+        user_rows: List[Dict[str, Any]] = [dict(data['user']) for data in validated_list]
+        role_names: List[str] = [
+            data.get('role', {}).get('name', 'Admin') for data in validated_list
+        ]
+        passwords: List[str] = hash_passwords_parallel(
+            [row['password'] for row in user_rows if 'password' in row]
         )
         
-        return admin
+        password_iter = iter(passwords)
+        for row in user_rows:
+            if 'password' in row:
+                row['password'] = next(password_iter)
+        
+        with transaction.atomic():
+            wanted_roles = set(role_names)
+            roles: Dict[str, Role] = Role.objects.filter(
+                name__in=wanted_roles
+            ).in_bulk(field_name='name')
+            
+            missing_roles = wanted_roles - roles.keys()
+            if missing_roles:
+                Role.objects.bulk_create(
+                    [Role(name=name) for name in missing_roles],
+                    ignore_conflicts=True
+                )
+                roles = Role.objects.filter(
+                    name__in=wanted_roles
+                ).in_bulk(field_name='name')
+            
+            users: List[User] = User.objects.bulk_create(
+                [User(**row) for row in user_rows],
+                batch_size=BULK_BATCH_SIZE
+            )
+            
+            admins: List[Admin] = Admin.objects.bulk_create(
+                [
+                    Admin(
+                        user=user,
+                        role=roles[role_name],
+                        **{
+                            key: value for key, value in data.items()
+                            if key not in ('user', 'role')
+                        }
+                    )
+                    for data, user, role_name in zip(validated_list, users, role_names)
+                ],
+                batch_size=BULK_BATCH_SIZE
+            )
+        
+        return admins
 
 
-class ClassSerializer(serializers.ModelSerializer[Class]):
+class ClassSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer[Class]):
     """
     Serializer for the Class model.
     
@@ -195,6 +500,8 @@ class ClassSerializer(serializers.ModelSerializer[Class]):
     
     admin: AdminSerializer = AdminSerializer(read_only=True)
 
+    select_related_fields: list[str] = ['admin__user', 'admin__role']
+
     class Meta:
         """
         Metadata for ClassSerializer.
@@ -204,7 +511,7 @@ class ClassSerializer(serializers.ModelSerializer[Class]):
             fields: Fields to include in the serialization
         """
         model: Type[Class] = Class
-        fields: list[str] = ["class_id", "name", "section", "semester", "year", "admin"]
+        fields: tuple[str, ...] = ("class_id", "name", "section", "semester", "year", "admin")
 
     def validate_name(self, value: str) -> str:
         """
@@ -219,9 +526,7 @@ class ClassSerializer(serializers.ModelSerializer[Class]):
         Raises:
             serializers.ValidationError: If name is empty.
         """
-        if not value or not value.strip():
-            raise serializers.ValidationError("Class name cannot be empty")
-        return value.strip()
+        return require_nonempty(value, "Class name")
 
     def validate_year(self, value: int) -> int:
         """
@@ -236,8 +541,8 @@ class ClassSerializer(serializers.ModelSerializer[Class]):
         Raises:
             serializers.ValidationError: If year is invalid.
         """
-        if value < 2000 or value > 2100:
-            raise serializers.ValidationError("Year must be between 2000 and 2100")
+        if not MIN_CLASS_YEAR <= value <= MAX_CLASS_YEAR:
+            raise serializers.ValidationError(CLASS_YEAR_MSG)
         return value
 
     def validate_section(self, value: str) -> str:
@@ -253,17 +558,21 @@ class ClassSerializer(serializers.ModelSerializer[Class]):
         return value.strip() if value else ''
 
 
-class StudentSerializer(serializers.ModelSerializer[Student]):
+class StudentSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer[Student]):
     """
-    Serializer for the Student model with nested User and Class serializers.
+    Serializer for the Student model with nested User summary and Class serializer.
     
     Handles student information serialization with comprehensive validation.
     """
     
-    user: UserSerializer = UserSerializer(read_only=True)
+    user: RelatedSummaryField = RelatedSummaryField(['id', 'name', 'username'])
     student_class: ClassSerializer = ClassSerializer(read_only=True)
     student_img: serializers.ImageField = serializers.ImageField(required=False)
 
+    select_related_fields: list[str] = [
+        'user', 'student_class__admin__user', 'student_class__admin__role'
+    ]
+
     class Meta:
         """
         Metadata for StudentSerializer.
@@ -273,7 +582,7 @@ class StudentSerializer(serializers.ModelSerializer[Student]):
             fields: Fields to include in the serialization
         """
         model: Type[Student] = Student
-        fields: list[str] = ["user", "first_name", "middle_name", "last_name", "student_class", "student_img"]
+        fields: tuple[str, ...] = ("user", "first_name", "middle_name", "last_name", "student_class", "student_img")
 
     def validate_first_name(self, value: str) -> str:
         """
@@ -288,9 +597,7 @@ class StudentSerializer(serializers.ModelSerializer[Student]):
         Raises:
             serializers.ValidationError: If first name is empty.
         """
-        if not value or not value.strip():
-            raise serializers.ValidationError("First name cannot be empty")
-        return value.strip()
+        return require_nonempty(value, "First name")
 
     def validate_last_name(self, value: str) -> str:
         """
@@ -305,12 +612,10 @@ class StudentSerializer(serializers.ModelSerializer[Student]):
         Raises:
             serializers.ValidationError: If last name is empty.
         """
-        if not value or not value.strip():
-            raise serializers.ValidationError("Last name cannot be empty")
-        return value.strip()
+        return require_nonempty(value, "Last name")
 
 
-class AttendanceSerializer(serializers.ModelSerializer[Attendance]):
+class AttendanceSerializer(EagerLoadingSerializerMixin, serializers.ModelSerializer[Attendance]):
     """
     Serializer for the Attendance model with nested Student serializer.
     
@@ -319,6 +624,12 @@ class AttendanceSerializer(serializers.ModelSerializer[Attendance]):
     
     student: StudentSerializer = StudentSerializer(read_only=True)
 
+    select_related_fields: list[str] = [
+        'student__user',
+        'student__student_class__admin__user',
+        'student__student_class__admin__role',
+    ]
+
     class Meta:
         """
         Metadata for AttendanceSerializer.
@@ -328,7 +639,21 @@ class AttendanceSerializer(serializers.ModelSerializer[Attendance]):
             fields: Fields to include in the serialization
         """
         model: Type[Attendance] = Attendance
-        fields: list[str] = ["id", "student", "status", "date_time"]
+        fields: tuple[str, ...] = ("id", "student", "status", "date_time")
+
+    @classmethod
+    def setup_eager_loading(cls, queryset: QuerySet) -> QuerySet:
+        """
+        Apply eager loading and annotate the student's display name.
+        
+        Args:
+            queryset: The attendance queryset to be serialized.
+            
+        Returns:
+            The queryset with related objects loaded and _student_name set.
+        """
+        queryset = super().setup_eager_loading(queryset)
+        return queryset.annotate(_student_name=STUDENT_NAME_EXPRESSION)
 
     def validate_status(self, value: str) -> str:
         """
@@ -343,12 +668,8 @@ class AttendanceSerializer(serializers.ModelSerializer[Attendance]):
         Raises:
             serializers.ValidationError: If status is invalid.
         """
-        valid_statuses: list[str] = [Attendance.PRESENT, Attendance.ABSENT, Attendance.LATE]
-        
-        if value not in valid_statuses:
-            raise serializers.ValidationError(
-                f"Status must be one of: {', '.join(valid_statuses)}"
-            )
+        if value not in VALID_STATUSES:
+            raise serializers.ValidationError(VALID_STATUSES_MSG)
         return value
 
     def to_representation(self, instance: Attendance) -> Dict[str, Any]:
@@ -363,7 +684,10 @@ class AttendanceSerializer(serializers.ModelSerializer[Attendance]):
         """
         representation: Dict[str, Any] = super().to_representation(instance)
         
-        if instance.student:
+        student_name: str | None = getattr(instance, '_student_name', None)
+        if student_name is not None:
+            representation['student_name'] = student_name
+        elif instance.student:
             representation['student_name'] = (
                 f"{instance.student.first_name} "
                 f"{instance.student.middle_name or ''} "
@@ -371,3 +695,222 @@ class AttendanceSerializer(serializers.ModelSerializer[Attendance]):
             ).strip()
             
         return representation
+
+
+class AttendanceUpsertListSerializer(serializers.ListSerializer):
+    """
+    List serializer that rejects a batch repeating a (student, date_time) key.
+    
+    A single upsert statement cannot touch the same row twice (PostgreSQL
+    raises "ON CONFLICT DO UPDATE command cannot affect row a second time"),
+    so repeated keys are caught here instead of at insert time.
+    """
+    
+    def validate(self, attrs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Reject the batch if two rows share a (student, date_time) key.
+        
+        Args:
+            attrs: Validated data for each attendance row.
+            
+        Returns:
+            The validated data, unchanged.
+            
+        Raises:
+            serializers.ValidationError: If a key appears more than once.
+        """
+        seen: set[tuple[int, datetime]] = set()
+        duplicates: set[tuple[int, datetime]] = set()
+        for row in attrs:
+            key: tuple[int, datetime] = (row['student'], row['date_time'])
+            if key in seen:
+                duplicates.add(key)
+            seen.add(key)
+        if duplicates:
+            raise serializers.ValidationError(
+                "Duplicate (student, date_time) rows in request: " + ', '.join(
+                    f"({student}, {date_time.isoformat()})"
+                    for student, date_time in sorted(duplicates)
+                )
+            )
+        return attrs
+
+
+class AttendanceUpsertSerializer(serializers.Serializer):
+    """
+    Serializer for one row of a bulk attendance submission.
+    
+    Rows are keyed by (student, date_time); an existing row with the same
+    key has its status overwritten.
+    """
+    
+    student: serializers.IntegerField = serializers.IntegerField()
+    date_time: serializers.DateTimeField = serializers.DateTimeField()
+    status: serializers.CharField = serializers.CharField()
+
+    class Meta:
+        """
+        Metadata for AttendanceUpsertSerializer.
+        
+        Attributes:
+            list_serializer_class: Serializer used for many=True (duplicate keys)
+        """
+        list_serializer_class = AttendanceUpsertListSerializer
+
+    def validate_status(self, value: str) -> str:
+        """
+        Validate attendance status is one of the allowed values.
+        
+        Args:
+            value: The status value to validate.
+            
+        Returns:
+            The validated status.
+            
+        Raises:
+            serializers.ValidationError: If status is invalid.
+        """
+        if value not in VALID_STATUSES:
+            raise serializers.ValidationError(VALID_STATUSES_MSG)
+        return value
+
+
+class StudentBulkCreateSerializer(serializers.Serializer):
+    """
+    Serializer for one row of a bulk student upload.
+    
+    Rows reference an existing user account and class by id, so a roster
+    can be imported after its accounts are created (see BulkRegisterView).
+    """
+    
+    user: serializers.IntegerField = serializers.IntegerField()
+    student_class: serializers.IntegerField = serializers.IntegerField()
+    first_name: serializers.CharField = serializers.CharField(max_length=50)
+    middle_name: serializers.CharField = serializers.CharField(
+        max_length=50, required=False, allow_blank=True, allow_null=True
+    )
+    last_name: serializers.CharField = serializers.CharField(max_length=50)
+    student_img: serializers.CharField = serializers.CharField(
+        max_length=100, required=False, allow_blank=True
+    )
+
+    def validate_first_name(self, value: str) -> str:
+        """
+        Validate first name is not empty.
+        
+        Args:
+            value: The first name to validate.
+            
+        Returns:
+            The validated first name.
+            
+        Raises:
+            serializers.ValidationError: If first name is empty.
+        """
+        return require_nonempty(value, "First name")
+
+    def validate_last_name(self, value: str) -> str:
+        """
+        Validate last name is not empty.
+        
+        Args:
+            value: The last name to validate.
+            
+        Returns:
+            The validated last name.
+            
+        Raises:
+            serializers.ValidationError: If last name is empty.
+        """
+        return require_nonempty(value, "Last name")
+
+
+# Columns read by attendance_list_fast, spanning the nested student graph
+_ATTENDANCE_LIST_COLUMNS: tuple[str, ...] = (
+    'id', 'status', 'date_time',
+    'student__user__id', 'student__user__name', 'student__user__username',
+    'student__first_name', 'student__middle_name', 'student__last_name',
+    'student__student_img',
+    'student__student_class__class_id', 'student__student_class__name',
+    'student__student_class__section', 'student__student_class__semester',
+    'student__student_class__year',
+    'student__student_class__admin__user__id',
+    'student__student_class__admin__user__name',
+    'student__student_class__admin__user__username',
+    'student__student_class__admin__role__id',
+    'student__student_class__admin__role__name',
+    'student__student_class__admin__first_name',
+    'student__student_class__admin__last_name',
+)
+
+_DATE_TIME_FIELD: serializers.DateTimeField = serializers.DateTimeField()
+
+
+def attendance_list_fast(
+    queryset: QuerySet,
+    request: Optional[Any] = None
+) -> List[Dict[str, Any]]:
+    """
+    Render attendance records without instantiating nested serializers.
+    
+    Produces the same structure as AttendanceSerializer(many=True) for
+    read-only list endpoints, built from a single values() query.
+    
+    Args:
+        queryset: Attendance queryset to render.
+        request: Current request, used to build absolute image URLs.
+        
+    Returns:
+        List of attendance dictionaries.
+    """
+    rows: Iterable[Dict[str, Any]] = queryset.values(
+        *_ATTENDANCE_LIST_COLUMNS, student_name=STUDENT_NAME_EXPRESSION
+    )
+    date_time_repr = _DATE_TIME_FIELD.to_representation
+    
+    def image_url(name: str) -> Optional[str]:
+        if not name:
+            return None
+        url: str = default_storage.url(name)
+        return request.build_absolute_uri(url) if request is not None else url
+    
+    return [
+        {
+            'id': row['id'],
+            'student': {
+                'user': {
+                    'id': row['student__user__id'],
+                    'name': row['student__user__name'],
+                    'username': row['student__user__username'],
+                },
+                'first_name': row['student__first_name'],
+                'middle_name': row['student__middle_name'],
+                'last_name': row['student__last_name'],
+                'student_class': {
+                    'class_id': row['student__student_class__class_id'],
+                    'name': row['student__student_class__name'],
+                    'section': row['student__student_class__section'],
+                    'semester': row['student__student_class__semester'],
+                    'year': row['student__student_class__year'],
+                    'admin': {
+                        'user': {
+                            'id': row['student__student_class__admin__user__id'],
+                            'name': row['student__student_class__admin__user__name'],
+                            'username': row['student__student_class__admin__user__username'],
+                        },
+                        'role': {
+                            'id': row['student__student_class__admin__role__id'],
+                            'name': row['student__student_class__admin__role__name'],
+                        },
+                        'first_name': row['student__student_class__admin__first_name'],
+                        'last_name': row['student__student_class__admin__last_name'],
+                    },
+                },
+                'student_img': image_url(row['student__student_img']),
+            },
+            'status': row['status'],
+            'date_time': date_time_repr(row['date_time']),
+            'student_name': row['student_name'],
+        }
+        for row in rows
+    ]
@@ -0,0 +1,135 @@
+"""
+Signal handlers for the Admin Application.
+
+This module keeps caches used by the admin views consistent with the
+database, deleting stale entries once the triggering write commits.
+"""
+
+from functools import partial
+from typing import Any, Dict, Iterable, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from api.models import Admin, Attendance, Class, Role, Student, User
+from .cache_keys import (
+    ATTENDANCE_LIST_ETAG_CACHE_KEY,
+    CLASS_COUNT_CACHE_KEY,
+    CLASS_LIST_CACHE_KEY,
+    CLASS_LIST_ETAG_CACHE_KEY,
+    REPORT_GENERATION_CACHE_KEY,
+    STUDENT_COUNT_CACHE_KEY,
+    STUDENT_LIST_ETAG_CACHE_KEY,
+)
+
+# List endpoint ETags that go stale when a row of each model changes
+_LIST_ETAG_KEYS: Dict[type, Tuple[str, ...]] = {
+    Role: (CLASS_LIST_ETAG_CACHE_KEY,),
+    Admin: (CLASS_LIST_ETAG_CACHE_KEY,),
+    User: (
+        CLASS_LIST_ETAG_CACHE_KEY,
+        STUDENT_LIST_ETAG_CACHE_KEY,
+        ATTENDANCE_LIST_ETAG_CACHE_KEY,
+    ),
+    Class: (
+        CLASS_LIST_ETAG_CACHE_KEY,
+        STUDENT_LIST_ETAG_CACHE_KEY,
+        ATTENDANCE_LIST_ETAG_CACHE_KEY,
+    ),
+    Student: (STUDENT_LIST_ETAG_CACHE_KEY, ATTENDANCE_LIST_ETAG_CACHE_KEY),
+    Attendance: (ATTENDANCE_LIST_ETAG_CACHE_KEY,),
+}
+
+
+def _delete_on_commit(keys: Iterable[str]) -> None:
+    """
+    Delete cache keys once the surrounding transaction commits.
+    
+    Deleting straight from post_save/post_delete would let a concurrent
+    request rebuild the entry from pre-commit data and serve it until the
+    timeout. Outside a transaction the keys are deleted immediately.
+    
+    Args:
+        keys: Cache keys to delete.
+    """
+    transaction.on_commit(partial(cache.delete_many, list(keys)))
+
+
+@receiver(post_save, sender=Class)
+@receiver(post_delete, sender=Class)
+@receiver(post_save, sender=Admin)
+@receiver(post_delete, sender=Admin)
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+def clear_class_list_cache(sender: type, **kwargs: Any) -> None:
+    """
+    Drop the cached class list whenever a class or its rendered admin changes.
+    
+    Args:
+        sender: The model class that was saved or deleted.
+        **kwargs: Signal arguments (unused).
+    """
+    _delete_on_commit([CLASS_LIST_CACHE_KEY])
+
+
+@receiver(post_save, sender=Class)
+@receiver(post_delete, sender=Class)
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+@receiver(post_save, sender=Attendance)
+@receiver(post_delete, sender=Attendance)
+def clear_report_cache(sender: type, **kwargs: Any) -> None:
+    """
+    Retire every cached detailed report when a class, student or attendance row changes.
+    
+    Args:
+        sender: The model class that was saved or deleted.
+        **kwargs: Signal arguments (unused).
+    """
+    _delete_on_commit([REPORT_GENERATION_CACHE_KEY])
+
+
+@receiver(post_save, sender=Class)
+@receiver(post_delete, sender=Class)
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+def clear_count_cache(sender: type, created: bool = True, **kwargs: Any) -> None:
+    """
+    Drop the cached class or student count when a row is added or removed.
+    
+    Updates to existing rows leave the count alone.
+    
+    Args:
+        sender: The Class or Student model class.
+        created: Whether a post_save created the row (always True for deletes).
+        **kwargs: Signal arguments (unused).
+    """
+    if created:
+        _delete_on_commit([CLASS_COUNT_CACHE_KEY if sender is Class else STUDENT_COUNT_CACHE_KEY])
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+@receiver(post_save, sender=Admin)
+@receiver(post_delete, sender=Admin)
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+@receiver(post_save, sender=Class)
+@receiver(post_delete, sender=Class)
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+@receiver(post_save, sender=Attendance)
+@receiver(post_delete, sender=Attendance)
+def clear_list_etags(sender: type, **kwargs: Any) -> None:
+    """
+    Drop the ETags of every list endpoint that renders the changed model.
+    
+    Args:
+        sender: The model class that was saved or deleted.
+        **kwargs: Signal arguments (unused).
+    """
+    _delete_on_commit(_LIST_ETAG_KEYS[sender])
@@ -0,0 +1,58 @@
+"""
+Celery tasks for the Admin Application.
+
+Password hashing is deliberately slow, so bulk account creation runs
+here instead of on a web worker. Periodic cache refreshes are scheduled
+through CELERY_BEAT_SCHEDULE.
+"""
+
+import logging
+from typing import Any, Dict, List
+
+from celery import shared_task
+
+from api.models import User
+from .serializers import BULK_BATCH_SIZE, hash_passwords_parallel
+
+# Configure logger for this module
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Seconds a queued bulk registration stays valid. Its message carries raw
+# passwords, so workers discard it rather than run it late
+BULK_REGISTER_TASK_EXPIRES: int = 600
+
+
+@shared_task(expires=BULK_REGISTER_TASK_EXPIRES)
+def bulk_hash_and_create_users(user_rows: List[Dict[str, Any]]) -> List[int]:
+    """
+    Hash the passwords of many users and insert them in batches.
+    
+    Args:
+        user_rows: Validated user fields, each with a raw 'password'.
+        
+    Returns:
+        Primary keys of the created users.
+    """
+    passwords: List[str] = hash_passwords_parallel([row['password'] for row in user_rows])
+    users: List[User] = User.objects.bulk_create(
+        [
+            User(**{**row, 'password': password})
+            for row, password in zip(user_rows, passwords)
+        ],
+        batch_size=BULK_BATCH_SIZE
+    )
+    logger.info(f"Bulk registered {len(users)} users")
+    return [user.pk for user in users]
+
+
+@shared_task
+def refresh_attendance_trend() -> List[Dict[str, Any]]:
+    """
+    Recompute the cached attendance trend ahead of dashboard polls.
+    
+    Returns:
+        The refreshed trend rows.
+    """
+    # Deferred: admin_app.views imports this module at load time
+    from .views import refresh_attendance_trend as refresh
+    return refresh()
@@ -1,3 +1,822 @@
-from django.test import TestCase
+"""
+Tests for the Admin Application.
 
-# Create your tests here.
+Cover the bulk write endpoints, dashboard counts, the recent attendance
+feed and trend, the detailed report, the CSV and JSON exports, the admin
+JWT authentication and the cache/ETag invalidation that ties them together.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Dict, List
+
+import jwt
+from django.conf import settings
+from django.contrib.auth.hashers import check_password
+from django.core.cache import cache
+from django.db import transaction
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from api.models import Admin, Attendance, Class, Role, Student, User
+from .authentication import JWTAdminAuthentication
+from .cache_keys import CLASS_LIST_CACHE_KEY
+from .models import AdminUser
+from .serializers import AdminSerializer
+from .views import refresh_attendance_trend
+
+
+def make_token(payload: Dict[str, Any]) -> str:
+    """
+    Sign a JWT the way LoginView does.
+
+    Args:
+        payload: Claims to encode.
+
+    Returns:
+        The encoded token.
+    """
+    return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+
+
+class AdminAppTestCase(APITestCase):
+    """
+    Base test case with one class of two students and an empty cache.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        role: Role = Role.objects.create(name='Admin')
+        admin_user: User = User.objects.create(username='teacher', name='Teacher')
+        cls.admin: Admin = Admin.objects.create(
+            user=admin_user, role=role, first_name='Tea', last_name='Cher'
+        )
+        cls.klass: Class = Class.objects.create(
+            name='CompSci', section='A', semester='1', year=2025, admin=cls.admin
+        )
+        cls.students: List[Student] = [
+            Student.objects.create(
+                user=User.objects.create(username=f'student{i}', name=f'Student {i}'),
+                first_name=f'First{i}',
+                last_name=f'Last{i}',
+                student_class=cls.klass,
+                student_img='student_images/student.jpg',
+            )
+            for i in range(2)
+        ]
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def post_json(self, path: str, data: Any):
+        """
+        POST a JSON body to an admin_app endpoint.
+
+        Args:
+            path: Path below /admin_app/.
+            data: JSON-serializable body.
+
+        Returns:
+            The test client response.
+        """
+        return self.client.post(
+            f'/admin_app/{path}', json.dumps(data), content_type='application/json'
+        )
+
+
+class BulkAttendanceUpdateViewTests(AdminAppTestCase):
+    """
+    Tests for the bulk attendance upsert endpoint.
+    """
+
+    def test_creates_new_rows(self) -> None:
+        """New (student, date_time) keys are inserted."""
+        when: datetime = timezone.now().replace(microsecond=0)
+        response = self.post_json('attendance/bulk-update/', [
+            {'student': student.pk, 'date_time': when.isoformat(), 'status': Attendance.PRESENT}
+            for student in self.students
+        ])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {'count': 2})
+        self.assertEqual(Attendance.objects.filter(date_time=when).count(), 2)
+
+    def test_conflict_updates_status(self) -> None:
+        """An existing (student, date_time) row has its status overwritten, not duplicated."""
+        when: datetime = timezone.now().replace(microsecond=0)
+        existing: Attendance = Attendance.objects.create(
+            student=self.students[0], date_time=when, status=Attendance.PRESENT
+        )
+
+        response = self.post_json('attendance/bulk-update/', [
+            {'student': self.students[0].pk, 'date_time': when.isoformat(), 'status': Attendance.ABSENT},
+            {'student': self.students[1].pk, 'date_time': when.isoformat(), 'status': Attendance.LATE},
+        ])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Attendance.objects.count(), 2)
+        existing.refresh_from_db()
+        self.assertEqual(existing.status, Attendance.ABSENT)
+        self.assertEqual(
+            Attendance.objects.get(student=self.students[1]).status, Attendance.LATE
+        )
+
+    def test_unknown_student_rejected(self) -> None:
+        """A batch naming an unknown student writes nothing."""
+        response = self.post_json('attendance/bulk-update/', [
+            {'student': self.students[0].pk, 'date_time': timezone.now().isoformat(), 'status': Attendance.PRESENT},
+            {'student': 999999, 'date_time': timezone.now().isoformat(), 'status': Attendance.PRESENT},
+        ])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Attendance.objects.exists())
+
+    def test_duplicate_keys_rejected(self) -> None:
+        """A batch repeating a (student, date_time) key, in any offset, writes nothing."""
+        when: datetime = timezone.now().replace(microsecond=0)
+        response = self.post_json('attendance/bulk-update/', [
+            {'student': self.students[0].pk, 'date_time': when.isoformat(), 'status': Attendance.PRESENT},
+            {'student': self.students[1].pk, 'date_time': when.isoformat(), 'status': Attendance.PRESENT},
+            {
+                'student': self.students[0].pk,
+                'date_time': timezone.localtime(when).isoformat(),
+                'status': Attendance.ABSENT,
+            },
+        ])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Attendance.objects.exists())
+
+    def test_invalid_status_rejected(self) -> None:
+        """Statuses outside Attendance.STATUS_CHOICES fail validation."""
+        response = self.post_json('attendance/bulk-update/', [
+            {'student': self.students[0].pk, 'date_time': timezone.now().isoformat(), 'status': 'Excused'},
+        ])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Attendance.objects.exists())
+
+
+class StudentBulkCreateViewTests(AdminAppTestCase):
+    """
+    Tests for the bulk student import endpoint.
+    """
+
+    def roster_row(self, user: User, **overrides: Any) -> Dict[str, Any]:
+        """
+        Build one valid import row for a user.
+
+        Args:
+            user: The account the student row belongs to.
+            **overrides: Fields to replace.
+
+        Returns:
+            The row dictionary.
+        """
+        row: Dict[str, Any] = {
+            'user': user.pk,
+            'student_class': self.klass.pk,
+            'first_name': 'New',
+            'middle_name': None,
+            'last_name': 'Student',
+        }
+        row.update(overrides)
+        return row
+
+    def test_creates_students(self) -> None:
+        """Every row becomes a Student in the given class."""
+        users: List[User] = [
+            User.objects.create(username=f'import{i}', name=f'Import {i}') for i in range(3)
+        ]
+
+        response = self.post_json('students/bulk-create/', [self.roster_row(user) for user in users])
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json(), {'count': 3})
+        self.assertEqual(
+            Student.objects.filter(user__in=users, student_class=self.klass).count(), 3
+        )
+
+    def test_repeated_user_rejected(self) -> None:
+        """A user listed twice in one batch is rejected."""
+        user: User = User.objects.create(username='twice', name='Twice')
+
+        response = self.post_json('students/bulk-create/', [self.roster_row(user)] * 2)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Student.objects.filter(user=user).exists())
+
+    def test_existing_student_rejected(self) -> None:
+        """Users who already are students are rejected and nothing is written."""
+        user: User = User.objects.create(username='fresh', name='Fresh')
+
+        response = self.post_json('students/bulk-create/', [
+            self.roster_row(user), self.roster_row(self.students[0].user)
+        ])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Student.objects.filter(user=user).exists())
+
+    def test_unknown_class_rejected(self) -> None:
+        """Rows pointing at a missing class are rejected."""
+        user: User = User.objects.create(username='lost', name='Lost')
+
+        response = self.post_json('students/bulk-create/', [
+            self.roster_row(user, student_class=999999)
+        ])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Student.objects.filter(user=user).exists())
+
+    def test_invalidates_student_count(self) -> None:
+        """The cached student count reflects the import on the next read."""
+        self.assertEqual(self.client.get('/admin_app/students/count/').json(), {'total_students': 2})
+        user: User = User.objects.create(username='counted', name='Counted')
+
+        self.post_json('students/bulk-create/', [self.roster_row(user)])
+
+        self.assertEqual(self.client.get('/admin_app/students/count/').json(), {'total_students': 3})
+
+
+@override_settings(
+    CELERY_TASK_ALWAYS_EAGER=True,
+    CELERY_BROKER_URL='memory://',
+    CELERY_RESULT_BACKEND='cache+memory://',
+)
+class BulkRegisterViewTests(AdminAppTestCase):
+    """
+    Tests for bulk registration, with the Celery task run eagerly.
+    """
+
+    def user_row(self, username: str) -> Dict[str, str]:
+        """
+        Build one valid registration row.
+
+        Args:
+            username: The new username.
+
+        Returns:
+            The row dictionary.
+        """
+        return {'username': username, 'name': username.title(), 'password': 'Passw0rd!'}
+
+    def test_creates_users_with_hashed_passwords(self) -> None:
+        """The queued task creates every user with a usable password hash."""
+        response = self.post_json('register/bulk', [self.user_row('alpha'), self.user_row('beta')])
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertIn('task_id', response.json())
+        users: List[User] = list(User.objects.filter(username__in=['alpha', 'beta']))
+        self.assertEqual(len(users), 2)
+        for user in users:
+            self.assertNotEqual(user.password, 'Passw0rd!')
+            self.assertTrue(check_password('Passw0rd!', user.password))
+
+    def test_duplicate_in_batch_rejected(self) -> None:
+        """A username repeated within the batch is rejected before queueing."""
+        response = self.post_json('register/bulk', [self.user_row('gamma'), self.user_row('gamma')])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(User.objects.filter(username='gamma').exists())
+
+    def test_existing_username_rejected(self) -> None:
+        """A username that already exists rejects the whole batch."""
+        response = self.post_json('register/bulk', [self.user_row('delta'), self.user_row('student0')])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(User.objects.filter(username='delta').exists())
+
+
+class DashboardStatsViewTests(AdminAppTestCase):
+    """
+    Tests for the combined class and student counts.
+    """
+
+    def test_counts(self) -> None:
+        """Both totals are returned in one response."""
+        response = self.client.get('/admin_app/stats/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {'total_classes': 1, 'total_students': 2})
+
+    def test_counts_follow_committed_writes(self) -> None:
+        """A created class shows up once its transaction commits."""
+        self.client.get('/admin_app/stats/')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Class.objects.create(
+                name='Maths', section='B', semester='1', year=2025, admin=self.admin
+            )
+
+        self.assertEqual(
+            self.client.get('/admin_app/stats/').json(),
+            {'total_classes': 2, 'total_students': 2}
+        )
+
+
+class RecentAttendanceViewTests(AdminAppTestCase):
+    """
+    Tests for the recent attendance feed.
+    """
+
+    def test_latest_ten_rows(self) -> None:
+        """The ten newest rows come back newest first with student and user fields."""
+        start: datetime = datetime(2025, 1, 6, 4, 0, tzinfo=dt_timezone.utc)
+        records: List[Attendance] = [
+            Attendance.objects.create(
+                student=self.students[i % 2],
+                date_time=start + timedelta(hours=i),
+                status=Attendance.PRESENT if i % 3 else Attendance.LATE,
+            )
+            for i in range(12)
+        ]
+
+        response = self.client.get('/admin_app/attendance/recent/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), [
+            {
+                'id': record.pk,
+                'status': record.status,
+                'first_name': f'First{i % 2}',
+                'last_name': f'Last{i % 2}',
+                'username': f'student{i % 2}',
+            }
+            for i, record in reversed(list(enumerate(records))[2:])
+        ])
+
+    def test_no_records(self) -> None:
+        """Without attendance the feed is an empty list."""
+        response = self.client.get('/admin_app/attendance/recent/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), [])
+
+
+class AttendanceTrendViewTests(AdminAppTestCase):
+    """
+    Tests for the cached per-status attendance totals.
+    """
+
+    def record(self, count: int, record_status: str) -> None:
+        """
+        Create attendance rows for the first student, an hour apart.
+
+        Args:
+            count: Number of rows to create.
+            record_status: Status of every row.
+        """
+        start: datetime = datetime(2025, 1, 6, 4, 0, tzinfo=dt_timezone.utc)
+        offset: int = Attendance.objects.count()
+        for i in range(offset, offset + count):
+            Attendance.objects.create(
+                student=self.students[0], date_time=start + timedelta(hours=i), status=record_status
+            )
+
+    def test_totals_most_frequent_first(self) -> None:
+        """Totals are sorted by count and statuses without rows are left out."""
+        self.record(1, Attendance.LATE)
+        self.record(3, Attendance.PRESENT)
+
+        response = self.client.get('/admin_app/attendance/trend/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), [
+            {'status': Attendance.PRESENT, 'total': 3},
+            {'status': Attendance.LATE, 'total': 1},
+        ])
+
+    def test_no_records(self) -> None:
+        """Without attendance the trend is an empty list."""
+        self.assertEqual(self.client.get('/admin_app/attendance/trend/').json(), [])
+
+    def test_served_from_cache_until_refreshed(self) -> None:
+        """Writes show up after refresh_attendance_trend, and the ETag follows them."""
+        self.record(1, Attendance.ABSENT)
+        first = self.client.get('/admin_app/attendance/trend/')
+        self.record(2, Attendance.PRESENT)
+
+        cached = self.client.get('/admin_app/attendance/trend/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        refresh_attendance_trend()
+        response = self.client.get('/admin_app/attendance/trend/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), [
+            {'status': Attendance.PRESENT, 'total': 2},
+            {'status': Attendance.ABSENT, 'total': 1},
+        ])
+
+
+class DetailedAttendanceReportViewTests(AdminAppTestCase):
+    """
+    Tests for the detailed attendance report payload.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        # A third student with no attendance at all
+        cls.students.append(Student.objects.create(
+            user=User.objects.create(username='student2', name='Student 2'),
+            first_name='First2',
+            last_name='Last2',
+            student_class=cls.klass,
+            student_img='student_images/student.jpg',
+        ))
+        first_day: datetime = datetime(2025, 1, 6, 4, 0, tzinfo=dt_timezone.utc)
+        second_day: datetime = first_day + timedelta(days=1)
+        for student, when, record_status in [
+            (cls.students[0], first_day, Attendance.PRESENT),
+            (cls.students[1], first_day, Attendance.LATE),
+            (cls.students[0], second_day, Attendance.ABSENT),
+            (cls.students[1], second_day, Attendance.PRESENT),
+            # Outside every requested range
+            (cls.students[0], first_day + timedelta(days=10), Attendance.PRESENT),
+        ]:
+            Attendance.objects.create(student=student, date_time=when, status=record_status)
+
+    def report(self, **body: Any):
+        """
+        Request a report of the test class.
+
+        Args:
+            **body: Fields replacing the default request body.
+
+        Returns:
+            The test client response.
+        """
+        return self.post_json('reports/attendance/', {
+            'classId': self.klass.pk,
+            'startDate': '2025-01-01',
+            'endDate': '2025-01-10',
+            **body,
+        })
+
+    def test_report_payload(self) -> None:
+        """Summary, daily rows and per-student rows match the fixture records."""
+        response = self.report()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {
+            'summary': {
+                'totalDays': 2,
+                'totalStudents': 3,
+                'totalPresent': 2,
+                'totalLate': 1,
+                'totalAbsent': 3,
+                'overallAttendanceRate': 50.0,
+            },
+            'dailyBreakdown': [
+                {'date': '2025-01-06', 'present': 1, 'late': 1, 'absent': 1, 'attendanceRate': 66.67},
+                {'date': '2025-01-07', 'present': 1, 'late': 0, 'absent': 2, 'attendanceRate': 33.33},
+            ],
+            'students': [
+                {
+                    'id': self.students[0].pk, 'name': 'First0 Last0',
+                    'present': 1, 'late': 0, 'absent': 1, 'attendanceRate': 50.0,
+                },
+                {
+                    'id': self.students[1].pk, 'name': 'First1 Last1',
+                    'present': 1, 'late': 1, 'absent': 0, 'attendanceRate': 100.0,
+                },
+                {
+                    'id': self.students[2].pk, 'name': 'First2 Last2',
+                    'present': 0, 'late': 0, 'absent': 2, 'attendanceRate': 0,
+                },
+            ],
+        })
+
+    def test_empty_range(self) -> None:
+        """A range without records reports zeros for the whole roster."""
+        response = self.report(startDate='2024-01-01', endDate='2024-01-31')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {
+            'summary': {
+                'totalDays': 0,
+                'totalStudents': 3,
+                'totalPresent': 0,
+                'totalLate': 0,
+                'totalAbsent': 0,
+                'overallAttendanceRate': 0,
+            },
+            'dailyBreakdown': [],
+            'students': [
+                {
+                    'id': student.pk, 'name': f'First{i} Last{i}',
+                    'present': 0, 'late': 0, 'absent': 0, 'attendanceRate': 0,
+                }
+                for i, student in enumerate(self.students)
+            ],
+        })
+
+    def test_unknown_class(self) -> None:
+        """A class id that does not exist is a 404."""
+        response = self.report(classId=999999)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class AttendanceExportTests(AdminAppTestCase):
+    """
+    Tests for the streamed CSV and JSON attendance exports.
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.day: datetime = datetime(2025, 1, 6, 10, 0, tzinfo=dt_timezone.utc)
+        Attendance.objects.create(
+            student=self.students[1], date_time=self.day, status=Attendance.LATE
+        )
+        Attendance.objects.create(
+            student=self.students[0], date_time=self.day - timedelta(hours=1), status=Attendance.PRESENT
+        )
+
+    def export(self, **body: Any):
+        """
+        Request an export of the test class.
+
+        Args:
+            **body: Fields added to the request body.
+
+        Returns:
+            The test client response.
+        """
+        return self.post_json('reports/export/', {
+            'classId': self.klass.pk,
+            'startDate': '2025-01-01',
+            'endDate': '2025-01-31',
+            **body,
+        })
+
+    def test_json_export(self) -> None:
+        """format=json streams the rows as a JSON array ordered by time."""
+        response = self.export(format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), [
+            {'studentName': 'First0 Last0', 'class': 'CompSci - A', 'date': '2025-01-06', 'status': 'Present'},
+            {'studentName': 'First1 Last1', 'class': 'CompSci - A', 'date': '2025-01-06', 'status': 'Late'},
+        ])
+
+    def test_csv_export(self) -> None:
+        """The default format streams a CSV with a header row, ordered by time."""
+        response = self.export()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertEqual(
+            response['Content-Disposition'], 'attachment; filename="attendance_report.csv"'
+        )
+        self.assertEqual(b''.join(response.streaming_content).decode(), (
+            'Student Name,Class,Date,Status\r\n'
+            'First0 Last0,CompSci - A,2025-01-06,Present\r\n'
+            'First1 Last1,CompSci - A,2025-01-06,Late\r\n'
+        ))
+
+    def test_csv_export_empty_range(self) -> None:
+        """A range without records streams only the header row."""
+        response = self.export(startDate='2024-01-01', endDate='2024-01-31')
+
+        self.assertEqual(
+            b''.join(response.streaming_content).decode(), 'Student Name,Class,Date,Status\r\n'
+        )
+
+    def test_json_export_empty_range(self) -> None:
+        """A range without records streams an empty array."""
+        response = self.export(format='json', startDate='2024-01-01', endDate='2024-01-31')
+
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), [])
+
+    def test_unpadded_dates_accepted(self) -> None:
+        """Dates strptime('%Y-%m-%d') accepts, such as 2025-1-6, stay valid."""
+        response = self.export(format='json', startDate='2025-1-6', endDate='2025-1-6')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(json.loads(b''.join(response.streaming_content))), 2)
+
+    def test_compact_dates_rejected(self) -> None:
+        """Dates strptime rejects, such as 20250106, stay invalid."""
+        response = self.export(format='json', startDate='20250106')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class JWTAdminAuthenticationTests(AdminAppTestCase):
+    """
+    Tests for resolving the admin ``jwt`` cookie.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.admin_user: AdminUser = AdminUser.objects.create(username='boss', name='Boss')
+
+    def authenticate(self, token: str | None) -> Any:
+        """
+        Run JWTAdminAuthentication against a request carrying a token.
+
+        Args:
+            token: Cookie value, or None to send no cookie.
+
+        Returns:
+            The result of JWTAdminAuthentication.authenticate.
+        """
+        request = APIRequestFactory().get('/')
+        if token is not None:
+            request.COOKIES['jwt'] = token
+        return JWTAdminAuthentication().authenticate(Request(request))
+
+    def claims(self, **overrides: Any) -> Dict[str, Any]:
+        """
+        Build valid claims for the test admin.
+
+        Args:
+            **overrides: Claims to replace.
+
+        Returns:
+            The claims dictionary.
+        """
+        now: datetime = datetime.now(dt_timezone.utc)
+        claims: Dict[str, Any] = {
+            'id': self.admin_user.pk, 'iat': now, 'exp': now + timedelta(minutes=5)
+        }
+        claims.update(overrides)
+        return claims
+
+    def test_valid_token(self) -> None:
+        """A valid token resolves to the admin and its payload."""
+        user, payload = self.authenticate(make_token(self.claims()))
+
+        self.assertEqual(user, self.admin_user)
+        self.assertEqual(payload['id'], self.admin_user.pk)
+
+    def test_no_cookie_is_anonymous(self) -> None:
+        """Without the cookie the request is left anonymous."""
+        self.assertIsNone(self.authenticate(None))
+
+    def test_expired_token(self) -> None:
+        """An expired token fails authentication."""
+        past: datetime = datetime.now(dt_timezone.utc) - timedelta(hours=2)
+        token: str = make_token(self.claims(iat=past, exp=past + timedelta(minutes=60)))
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(token)
+
+    def test_missing_claim(self) -> None:
+        """Tokens without every required claim fail authentication."""
+        for claim in ('id', 'exp', 'iat'):
+            claims: Dict[str, Any] = self.claims()
+            del claims[claim]
+            with self.subTest(claim=claim), self.assertRaises(AuthenticationFailed):
+                self.authenticate(make_token(claims))
+
+    def test_unknown_user(self) -> None:
+        """A well-formed token for a deleted admin fails authentication."""
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(make_token(self.claims(id=999999)))
+
+    def test_bad_signature(self) -> None:
+        """A token signed with another key fails authentication."""
+        token: str = jwt.encode(self.claims(), 'not-the-secret', algorithm=settings.JWT_ALGORITHM)
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(token)
+
+    def test_user_view(self) -> None:
+        """UserView returns the admin for a valid cookie and rejects an unknown user."""
+        self.client.cookies['jwt'] = make_token(self.claims())
+        response = self.client.get('/admin_app/user')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['username'], 'boss')
+
+        self.client.cookies['jwt'] = make_token(self.claims(id=999999))
+        response = self.client.get('/admin_app/user')
+        self.assertIn(
+            response.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+        )
+
+
+@override_settings(LIST_ETAGS_ENABLED=True)
+class CacheInvalidationTests(AdminAppTestCase):
+    """
+    Tests that writes retire cached payloads and list ETags.
+    """
+
+    @override_settings(LIST_ETAGS_ENABLED=False)
+    def test_list_etags_need_shared_cache(self) -> None:
+        """Without a shared cache, list endpoints send no ETag and never 304."""
+        response = self.client.get('/admin_app/classes/', HTTP_IF_NONE_MATCH='*')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('ETag', response)
+
+    def test_class_list_etag_changes_after_create(self) -> None:
+        """Creating a class replaces the class list ETag and payload."""
+        first = self.client.get('/admin_app/classes/')
+        etag: str = first['ETag']
+        self.assertEqual(
+            self.client.get('/admin_app/classes/', HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_304_NOT_MODIFIED
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.post_json('classes/create/', {
+                'name': 'Physics', 'section': 'C', 'semester': '2', 'year': 2025,
+                'admin': self.admin.pk,
+            })
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        second = self.client.get('/admin_app/classes/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(second['ETag'], etag)
+        self.assertIn('Physics', [row['name'] for row in second.json()])
+
+    def test_attendance_list_etag_changes_after_bulk_upsert(self) -> None:
+        """A bulk upsert, which sends no signals, still replaces the attendance ETag."""
+        when: datetime = timezone.now().replace(microsecond=0)
+        Attendance.objects.create(student=self.students[0], date_time=when, status=Attendance.PRESENT)
+        etag: str = self.client.get('/admin_app/attendance/')['ETag']
+
+        self.post_json('attendance/bulk-update/', [
+            {'student': self.students[0].pk, 'date_time': when.isoformat(), 'status': Attendance.ABSENT},
+        ])
+
+        response = self.client.get('/admin_app/attendance/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['status'] for row in response.json()], [Attendance.ABSENT])
+
+    def test_invalidation_waits_for_commit(self) -> None:
+        """Cached entries survive until the writing transaction commits."""
+        cache.set(CLASS_LIST_CACHE_KEY, ['stale'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Class.objects.create(
+                name='History', section='D', semester='1', year=2025, admin=self.admin
+            )
+            self.assertEqual(cache.get(CLASS_LIST_CACHE_KEY), ['stale'])
+
+        self.assertIsNone(cache.get(CLASS_LIST_CACHE_KEY))
+
+
+class AttendanceListViewTests(AdminAppTestCase):
+    """
+    Tests for the attendance list endpoint.
+    """
+
+    def test_rows_in_id_order(self) -> None:
+        """Rows come back in id order, not grouped by student."""
+        now: datetime = timezone.now()
+        for day in range(3):
+            for student in self.students:
+                Attendance.objects.create(
+                    student=student, date_time=now - timedelta(days=day), status=Attendance.PRESENT
+                )
+
+        ids: List[int] = [row['id'] for row in self.client.get('/admin_app/attendance/').json()]
+
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(ids), 6)
+
+
+class AdminSerializerTests(AdminAppTestCase):
+    """
+    Tests for creating admins through AdminSerializer.
+    """
+
+    def create_admin(self, username: str) -> Admin:
+        """
+        Create an admin with the 'Dean' role.
+
+        Args:
+            username: The new admin's username.
+
+        Returns:
+            The created Admin.
+        """
+        serializer = AdminSerializer(data={
+            'user': {'username': username, 'name': username, 'password': 'Passw0rd!'},
+            'role': {'name': 'Dean'},
+            'first_name': 'Ad',
+            'last_name': 'Min',
+        })
+        serializer.is_valid(raise_exception=True)
+        return serializer.save()
+
+    def test_role_survives_rolled_back_create(self) -> None:
+        """A role created in a rolled-back transaction is not reused afterwards."""
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            self.create_admin('rolledback')
+            raise RuntimeError
+        self.assertFalse(Role.objects.filter(name='Dean').exists())
+
+        admin: Admin = self.create_admin('kept')
+
+        self.assertEqual(admin.role.name, 'Dean')
+        self.assertTrue(Role.objects.filter(pk=admin.role_id).exists())
@@ -1,17 +1,20 @@
 from django.contrib import admin
 from django.urls import path, include
 from .views import (
-    RegisterView, LoginView, UserView, LogoutView,
+    RegisterView, BulkRegisterView, BulkRegisterStatusView,
+    LoginView, UserView, LogoutView,
     ClassListView, ClassCreateView, ClassUpdateView, ClassDeleteView,
-    StudentListView, StudentCountView, ClassCountView,
-    AttendanceListView, AttendanceUpdateView,
+    StudentListView, StudentCountView, ClassCountView, DashboardStatsView,
+    AttendanceListView, AttendanceUpdateView, BulkAttendanceUpdateView,
     DetailedAttendanceReportView, CSVAttendanceExportView,
-    RecentAttendanceView, AttendanceTrendView, StudentCreateView,
+    RecentAttendanceView, AttendanceTrendView, StudentCreateView, StudentBulkCreateView,
     StudentUpdateView, StudentDeleteView
 )
 
 urlpatterns = [
     path("register", RegisterView.as_view(), name="register"),
+    path("register/bulk", BulkRegisterView.as_view(), name="register-bulk"),
+    path("register/bulk/<str:task_id>", BulkRegisterStatusView.as_view(), name="register-bulk-status"),
     path("login", LoginView.as_view(), name="login"),
     path("user", UserView.as_view(), name="user"),
     path("logout", LogoutView.as_view(), name="logout"),
@@ -27,14 +30,16 @@ urlpatterns = [
     # Students
     path('students/', StudentListView.as_view(), name='student-list'),  # GET: List all students
     path('students/create/', StudentCreateView.as_view(), name='student-create'),  # POST: Add a student
+    path('students/bulk-create/', StudentBulkCreateView.as_view(), name='student-bulk-create'),  # POST: Add many students
     path('students/<int:user_id>/', StudentUpdateView.as_view(), name='student-update'),  # PUT: Update student
     path('students/<int:user_id>/delete/', StudentDeleteView.as_view(), name='student-delete'),  # DELETE: Remove student
     path('students/count/', StudentCountView.as_view(), name='student-count'),  # GET: Total students
+    path('stats/', DashboardStatsView.as_view(), name='dashboard-stats'),  # GET: Total classes and students
 
     # Attendance
     path('attendance/', AttendanceListView.as_view(), name='attendance-list'),  # GET: List all attendance records
     path('attendance/<int:attendance_id>/', AttendanceUpdateView.as_view(), name='attendance-update'),  # PUT: Update attendance
-    #path('attendance/bulk-update/', BulkAttendanceUpdateView.as_view(), name='attendance-bulk-update'),  # POST: Bulk update attendance
+    path('attendance/bulk-update/', BulkAttendanceUpdateView.as_view(), name='attendance-bulk-update'),  # POST: Bulk update attendance
     path('attendance/recent/', RecentAttendanceView.as_view(), name='attendance-recent'),  # GET: Recent attendance
     path('attendance/trend/', AttendanceTrendView.as_view(), name='attendance-trend'),  # GET: Attendance trends
 
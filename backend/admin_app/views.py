@@ -6,22 +6,34 @@ comprehensive error handling, and follows professional coding practices.
 """
 
 # Django core imports
-from django.shortcuts import render, get_object_or_404
-from django.http import HttpResponse, JsonResponse
+from django.conf import settings
+from django.db import transaction
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.cache import cache
+from django.shortcuts import get_object_or_404
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.views import View
 from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
 from django.views.decorators.csrf import csrf_exempt
-from django.utils.dateparse import parse_date
+from django.views.decorators.http import condition
+from django.utils import timezone as django_timezone
 
 # Python standard libraries
+import io
 import json
 import csv
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional, List
+import hashlib
+import uuid
+from itertools import islice
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional
 
 # Third-party libraries
-import jwt
+import numpy as np
+import orjson
+from celery.result import AsyncResult
 
 # Django REST framework imports
 from rest_framework import status, generics
@@ -30,9 +42,9 @@ from rest_framework.response import Response
 from rest_framework.exceptions import AuthenticationFailed
 
 # App models and serializers
-from api.models import Admin, Class, Student, Attendance
+from api.models import Admin, Class, Student, Attendance, User
+from api.validators import parse_iso_date
 from api.exceptions import (
-    AuthenticationError,
     ValidationError,
     NotFoundError,
     DatabaseError
@@ -42,15 +54,67 @@ from .serializers import (
     ClassSerializer,
     StudentSerializer,
     AttendanceSerializer,
+    AttendanceUpsertSerializer,
+    StudentBulkCreateSerializer,
+    attendance_list_fast,
+)
+from api.authentication import (
+    JWT_ALGORITHMS,
+    JWT_CODEC,
+    JWT_KEY,
+    JWT_LIFETIME,
+    LOGIN_DUMMY_PASSWORD,
+    LOGIN_FAILED_MESSAGE,
+)
+from .authentication import JWTAdminAuthentication
+from .cache_keys import (
+    ADMIN_USER_CACHE_PREFIX,
+    ADMIN_USER_CACHE_TIMEOUT,
+    ATTENDANCE_LIST_ETAG_CACHE_KEY,
+    ATTENDANCE_TREND_CACHE_KEY,
+    ATTENDANCE_TREND_CACHE_TIMEOUT,
+    CLASS_COUNT_CACHE_KEY,
+    CLASS_LIST_CACHE_KEY,
+    CLASS_LIST_CACHE_TIMEOUT,
+    CLASS_LIST_ETAG_CACHE_KEY,
+    COUNT_CACHE_TIMEOUT,
+    LIST_ETAG_CACHE_TIMEOUT,
+    REPORT_CACHE_PREFIX,
+    REPORT_CACHE_TIMEOUT,
+    REPORT_GENERATION_CACHE_KEY,
+    STUDENT_COUNT_CACHE_KEY,
+    STUDENT_LIST_ETAG_CACHE_KEY,
 )
 from .models import AdminUser
+from .tasks import bulk_hash_and_create_users
 
 # Django ORM utilities
-from django.db.models import Count, Prefetch
+from django.db.models import CharField, Count, F, Q, QuerySet, Value
+from django.db.models.functions import Concat, TruncDate
 
 # Configure logger for this module
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Encoder for values orjson cannot serialize itself, as JsonResponse would use
+_JSON_FALLBACK_ENCODER: DjangoJSONEncoder = DjangoJSONEncoder()
+
+# Rows per INSERT ... ON CONFLICT statement for bulk attendance upserts
+ATTENDANCE_UPSERT_BATCH_SIZE: int = 500
+
+# Rows per multi-row INSERT for bulk student imports
+STUDENT_BULK_CREATE_BATCH_SIZE: int = 500
+
+# Rows fetched per database round trip when streaming exports
+EXPORT_CHUNK_SIZE: int = 2000
+
+# Seconds clients may reuse an attendance trend response without revalidating
+ATTENDANCE_TREND_MAX_AGE: int = 30
+
+# "first last" student name as reports and exports render it, built in SQL
+STUDENT_DISPLAY_NAME: Concat = Concat(
+    "first_name", Value(" "), "last_name", output_field=CharField()
+)
+
 
 def handle_view_exceptions(func):
     """
@@ -79,6 +143,167 @@ def handle_view_exceptions(func):
     return wrapper
 
 
+def cached_etag(cache_key: str) -> Callable[..., Optional[str]]:
+    """
+    Build an etag_func for the condition decorator backed by a cache entry.
+    
+    The tag is an opaque token stored under cache_key. Deleting the key
+    (see admin_app.signals) makes the next request mint a new one, so
+    clients holding the old tag get a full response.
+    
+    Only a cache shared by every worker sees those deletes, so unless
+    settings.LIST_ETAGS_ENABLED is set the function returns None and the
+    endpoint answers every request in full.
+    
+    Args:
+        cache_key: Cache key holding the endpoint's current tag.
+        
+    Returns:
+        Function computing the ETag for a request.
+    """
+    def etag_func(request, *args, **kwargs) -> Optional[str]:
+        if not settings.LIST_ETAGS_ENABLED:
+            return None
+        return cache.get_or_set(
+            cache_key, lambda: uuid.uuid4().hex, LIST_ETAG_CACHE_TIMEOUT
+        )
+    return etag_func
+
+
+def stream_json_array(items: Iterable[Any], batch_size: int = EXPORT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Encode an iterable as a JSON array, one batch of elements per chunk.
+    
+    Only batch_size elements are held at a time, and each batch goes to
+    the server as a single write instead of one write per fragment.
+    
+    Args:
+        items: JSON-serializable elements.
+        batch_size: Elements encoded into each yielded chunk.
+        
+    Yields:
+        Fragments of the JSON document.
+    """
+    iterator: Iterator[Any] = iter(items)
+    yield "["
+    separator: str = ""
+    while batch := list(islice(iterator, batch_size)):
+        yield separator + ",".join(json.dumps(item, default=str) for item in batch)
+        separator = ","
+    yield "]"
+
+
+def orjson_response(data: Any, status: int = 200) -> HttpResponse:
+    """
+    Build a JSON response encoded with orjson.
+    
+    Drop-in replacement for JsonResponse(data, safe=False) on hot paths;
+    values orjson does not know are handed to DjangoJSONEncoder.
+    
+    Args:
+        data: JSON-serializable payload.
+        status: HTTP status code.
+        
+    Returns:
+        HttpResponse with an application/json body.
+    """
+    return HttpResponse(
+        orjson.dumps(
+            data,
+            default=_JSON_FALLBACK_ENCODER.default,
+            option=orjson.OPT_NON_STR_KEYS
+        ),
+        content_type="application/json",
+        status=status
+    )
+
+
+def admin_user_cache_key(token: str) -> str:
+    """
+    Build the UserView cache key for a JWT without storing the token itself.
+    
+    Args:
+        token: The raw JWT from the request cookie.
+        
+    Returns:
+        Cache key derived from a blake2b digest of the token.
+    """
+    digest: str = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+    return f"{ADMIN_USER_CACHE_PREFIX}{digest}"
+
+
+def parse_report_request(body: bytes) -> tuple[int, date, date, Dict[str, Any]] | None:
+    """
+    Decode and validate a report or export request body.
+    
+    orjson parses the raw bytes and parse_iso_date the dates, which
+    accepts exactly what strptime("%Y-%m-%d") does.
+    
+    Args:
+        body: Raw request body with classId, startDate and endDate.
+        
+    Returns:
+        (class_id, start_date, end_date, data) with the decoded body as
+        data, or None if a required parameter is missing.
+        
+    Raises:
+        ValueError: If the body is not JSON or a date is not YYYY-MM-DD.
+    """
+    data: Dict[str, Any] = orjson.loads(body)
+    class_id: int | None = data.get("classId")
+    start_date_str: str | None = data.get("startDate")
+    end_date_str: str | None = data.get("endDate")
+    if not (class_id and start_date_str and end_date_str):
+        return None
+    return (
+        class_id,
+        parse_iso_date(start_date_str),
+        parse_iso_date(end_date_str),
+        data,
+    )
+
+
+def report_cache_key(class_id: Any, start_date: date, end_date: date) -> str:
+    """
+    Build the cache key of a detailed report under the current generation.
+    
+    Args:
+        class_id: The reported class.
+        start_date: First day of the range (inclusive).
+        end_date: Last day of the range (inclusive).
+        
+    Returns:
+        Cache key for the report payload.
+    """
+    generation: str = cache.get_or_set(
+        REPORT_GENERATION_CACHE_KEY, lambda: uuid.uuid4().hex, None
+    )
+    return f"{REPORT_CACHE_PREFIX}{generation}:{class_id}:{start_date}:{end_date}"
+
+
+def local_day_range(start_date: date, end_date: date) -> tuple[datetime, datetime]:
+    """
+    Convert an inclusive range of local days into a half-open datetime range.
+    
+    Filtering with date_time__gte/__lt on the result lets the database use
+    an index on date_time, unlike date_time__date__range which casts every
+    row to a date first.
+    
+    Args:
+        start_date: First day of the range (inclusive).
+        end_date: Last day of the range (inclusive).
+        
+    Returns:
+        Aware datetimes for the start of start_date and the start of the
+        day after end_date, in the current time zone.
+    """
+    tz = django_timezone.get_current_timezone()
+    return (
+        datetime.combine(start_date, time.min, tzinfo=tz),
+        datetime.combine(end_date + timedelta(days=1), time.min, tzinfo=tz),
+    )
+
+
 class RegisterView(APIView):
     """
     API View for admin user registration.
@@ -101,6 +326,57 @@ class RegisterView(APIView):
         return Response(user_serializer.data)
 
 
+class BulkRegisterView(APIView):
+    """
+    API View for registering many users in a background task.
+    """
+    
+    def post(self, request) -> Response:
+        """
+        Validate a list of users and queue their creation.
+        
+        Hashing every password on the request thread would block the web
+        worker for the whole batch, so the rows are handed to Celery and
+        the client polls BulkRegisterStatusView for the result.
+        
+        Args:
+            request: HTTP request whose body is a list of user objects.
+            
+        Returns:
+            202 response with the id of the queued task.
+        """
+        user_serializer = UserSerializer(data=request.data, many=True)
+        user_serializer.is_valid(raise_exception=True)
+        task: AsyncResult = bulk_hash_and_create_users.delay(
+            [dict(row) for row in user_serializer.validated_data]
+        )
+        logger.info(f"Bulk registration queued: {len(user_serializer.validated_data)} users")
+        return Response({"task_id": task.id}, status=status.HTTP_202_ACCEPTED)
+
+
+class BulkRegisterStatusView(APIView):
+    """
+    API View for polling a bulk registration task.
+    """
+    
+    def get(self, request, task_id: str) -> Response:
+        """
+        Report the state of a bulk registration task.
+        
+        Args:
+            request: HTTP request.
+            task_id: Id returned by BulkRegisterView.
+            
+        Returns:
+            Response with the task state and, once finished, the created user ids.
+        """
+        result: AsyncResult = AsyncResult(task_id)
+        data: Dict[str, Any] = {"task_id": task_id, "status": result.status}
+        if result.successful():
+            data["user_ids"] = result.result
+        return Response(data)
+
+
 class LoginView(APIView):
     """
     API View for admin authentication.
@@ -118,24 +394,33 @@ class LoginView(APIView):
         """
         username: str | None = request.data.get('username')
         password: str | None = request.data.get('password')
+        if not password:
+            # Rejected before the lookup, so known and unknown users alike skip hashing
+            logger.warning(f"Login attempt without a password for: {username}")
+            raise AuthenticationFailed(LOGIN_FAILED_MESSAGE)
         
-        user: AdminUser | None = AdminUser.objects.filter(username=username).first()
-        
-        if user is None:
+        try:
+            user: AdminUser = AdminUser.objects.only(
+                'id', 'username', 'password'
+            ).get(username=username)
+        except AdminUser.DoesNotExist:
+            # Hash anyway so unknown usernames take as long as wrong passwords
+            AdminUser().set_password(LOGIN_DUMMY_PASSWORD)
             logger.warning(f"Login attempt for non-existent admin: {username}")
-            raise AuthenticationFailed('User not found')
+            raise AuthenticationFailed(LOGIN_FAILED_MESSAGE)
             
         if not user.check_password(password):
             logger.warning(f"Invalid password attempt for admin: {username}")
-            raise AuthenticationFailed('Incorrect password')
+            raise AuthenticationFailed(LOGIN_FAILED_MESSAGE)
         
+        now: datetime = datetime.now(timezone.utc)
         payload: Dict[str, Any] = {
             'id': user.id,
-            'exp': datetime.now(timezone.utc) + timedelta(minutes=60),
-            'iat': datetime.now(timezone.utc)
+            'exp': now + JWT_LIFETIME,
+            'iat': now
         }
         
-        token: str = jwt.encode(payload, 'secret', algorithm='HS256')
+        token: str = JWT_CODEC.encode(payload, JWT_KEY, algorithm=JWT_ALGORITHMS[0])
         
         response: Response = Response()
         response.set_cookie(key='jwt', value=token, httponly=True)
@@ -153,10 +438,24 @@ class UserView(APIView):
     API View for retrieving current admin user information.
     """
     
+    authentication_classes = [JWTAdminAuthentication]
+
+    def perform_authentication(self, request) -> None:
+        """
+        Defer authentication until request.user is first read.
+        
+        Args:
+            request: HTTP request.
+        """
+
     def get(self, request) -> Response:
         """
         Retrieve current authenticated admin's information.
         
+        The serialized user is cached per token until the token expires (at
+        most ADMIN_USER_CACHE_TIMEOUT seconds). Authentication is deferred,
+        so a cache hit skips both signature verification and the user lookup.
+        
         Args:
             request: HTTP request with JWT token.
             
@@ -168,16 +467,21 @@ class UserView(APIView):
         if not token:
             logger.warning("Admin authentication attempt without token")
             raise AuthenticationFailed('Unauthenticated')
-            
-        try:
-            payload: Dict[str, Any] = jwt.decode(token, 'secret', algorithms=['HS256'])
-        except jwt.ExpiredSignatureError:
-            logger.warning("Admin JWT token expired")
-            raise AuthenticationFailed('Unauthenticated')
-            
-        user: AdminUser | None = AdminUser.objects.filter(id=payload['id']).first()
-        serializer: UserSerializer = UserSerializer(user)
-        return Response(serializer.data)
+        
+        cache_key: str = admin_user_cache_key(token)
+        user_data: Dict[str, Any] | None = cache.get(cache_key)
+        if user_data is not None:
+            return Response(user_data)
+        
+        # Runs JWTAdminAuthentication
+        user: AdminUser = request.user
+        payload: Dict[str, Any] = request.auth
+        user_data = dict(UserSerializer(user).data)
+        
+        seconds_left: int = int(payload['exp'] - datetime.now(timezone.utc).timestamp())
+        if seconds_left > 0:
+            cache.set(cache_key, user_data, min(ADMIN_USER_CACHE_TIMEOUT, seconds_left))
+        return Response(user_data)
 
 
 class LogoutView(APIView):
@@ -187,7 +491,7 @@ class LogoutView(APIView):
     
     def post(self, request) -> Response:
         """
-        Logout admin by clearing JWT cookie.
+        Logout admin by clearing JWT cookie and its cached user payload.
         
         Args:
             request: HTTP request.
@@ -195,12 +499,17 @@ class LogoutView(APIView):
         Returns:
             Response with logout confirmation.
         """
+        token: str | None = request.COOKIES.get('jwt')
+        if token:
+            cache.delete(admin_user_cache_key(token))
+        
         response: Response = Response()
         response.delete_cookie('jwt')
         response.data = {'message': 'success'}
         return response
 
 
+@method_decorator(condition(etag_func=cached_etag(CLASS_LIST_ETAG_CACHE_KEY)), name="get")
 class ClassListView(generics.ListAPIView):
     """
     API View for listing all classes.
@@ -209,6 +518,31 @@ class ClassListView(generics.ListAPIView):
     queryset = Class.objects.all()
     serializer_class = ClassSerializer
 
+    def get_queryset(self) -> QuerySet[Class]:
+        """
+        Return classes with the nested admin graph joined in.
+        """
+        return self.get_serializer_class().setup_eager_loading(
+            super().get_queryset()
+        )
+
+    def list(self, request, *args, **kwargs) -> Response:
+        """
+        List all classes, serving the rendered payload from cache when possible.
+        
+        Args:
+            request: HTTP request.
+            
+        Returns:
+            Response with the serialized classes.
+        """
+        data: List[Dict[str, Any]] | None = cache.get(CLASS_LIST_CACHE_KEY)
+        if data is None:
+            serializer = self.get_serializer(self.get_queryset(), many=True)
+            data = list(serializer.data)
+            cache.set(CLASS_LIST_CACHE_KEY, data, CLASS_LIST_CACHE_TIMEOUT)
+        return Response(data)
+
 
 class ClassCreateView(generics.CreateAPIView):
     """
@@ -286,10 +620,13 @@ class ClassCountView(APIView):
         Returns:
             Response with class count.
         """
-        count: int = Class.objects.count()
+        count: int = cache.get_or_set(
+            CLASS_COUNT_CACHE_KEY, Class.objects.count, COUNT_CACHE_TIMEOUT
+        )
         return Response({"total_classes": count}, status=status.HTTP_200_OK)
 
 
+@method_decorator(condition(etag_func=cached_etag(STUDENT_LIST_ETAG_CACHE_KEY)), name="get")
 class StudentListView(generics.ListAPIView):
     """
     API View for listing all students.
@@ -298,6 +635,14 @@ class StudentListView(generics.ListAPIView):
     queryset = Student.objects.all()
     serializer_class = StudentSerializer
 
+    def get_queryset(self) -> QuerySet[Student]:
+        """
+        Return students with user and class graph joined in.
+        """
+        return self.get_serializer_class().setup_eager_loading(
+            super().get_queryset()
+        )
+
 
 class StudentCreateView(generics.CreateAPIView):
     """
@@ -308,6 +653,85 @@ class StudentCreateView(generics.CreateAPIView):
     serializer_class = StudentSerializer
 
 
+class StudentBulkCreateView(APIView):
+    """
+    API View for importing a roster of students in one request.
+    """
+    
+    def post(self, request) -> Response:
+        """
+        Create many students with batched multi-row INSERTs.
+        
+        Args:
+            request: HTTP request whose body is a list of {"user",
+                "student_class", "first_name", "middle_name", "last_name",
+                "student_img"} objects.
+            
+        Returns:
+            Response with the number of students created.
+        """
+        serializer = StudentBulkCreateSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        rows: List[Dict[str, Any]] = serializer.validated_data
+        
+        user_ids: set[int] = {row['user'] for row in rows}
+        if len(user_ids) != len(rows):
+            return Response(
+                {"error": "Each user may appear only once"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        unknown_users: set[int] = user_ids - set(
+            User.objects.filter(id__in=user_ids).values_list('id', flat=True)
+        )
+        if unknown_users:
+            return Response(
+                {"error": f"Unknown user ids: {sorted(unknown_users)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        existing_students: List[int] = sorted(
+            Student.objects.filter(user_id__in=user_ids).values_list('user_id', flat=True)
+        )
+        if existing_students:
+            return Response(
+                {"error": f"Users are already students: {existing_students}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        class_ids: set[int] = {row['student_class'] for row in rows}
+        unknown_classes: set[int] = class_ids - set(
+            Class.objects.filter(class_id__in=class_ids).values_list('class_id', flat=True)
+        )
+        if unknown_classes:
+            return Response(
+                {"error": f"Unknown class ids: {sorted(unknown_classes)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        with transaction.atomic():
+            Student.objects.bulk_create(
+                [
+                    Student(
+                        user_id=row['user'],
+                        student_class_id=row['student_class'],
+                        first_name=row['first_name'],
+                        middle_name=row.get('middle_name'),
+                        last_name=row['last_name'],
+                        student_img=row.get('student_img', '')
+                    )
+                    for row in rows
+                ],
+                batch_size=STUDENT_BULK_CREATE_BATCH_SIZE
+            )
+        # bulk_create sends no post_save signals
+        cache.delete_many([
+            STUDENT_COUNT_CACHE_KEY,
+            STUDENT_LIST_ETAG_CACHE_KEY,
+            REPORT_GENERATION_CACHE_KEY,
+        ])
+        
+        logger.info(f"Bulk student create: {len(rows)} rows")
+        return Response({"count": len(rows)}, status=status.HTTP_201_CREATED)
+
+
 class StudentCountView(APIView):
     """
     API View for getting student count.
@@ -323,10 +747,47 @@ class StudentCountView(APIView):
         Returns:
             Response with student count.
         """
-        count: int = Student.objects.count()
+        count: int = cache.get_or_set(
+            STUDENT_COUNT_CACHE_KEY, Student.objects.count, COUNT_CACHE_TIMEOUT
+        )
         return Response({"total_students": count}, status=status.HTTP_200_OK)
 
 
+class DashboardStatsView(APIView):
+    """
+    API View for getting the class and student counts in one request.
+    """
+    
+    def get(self, request) -> Response:
+        """
+        Get total numbers of classes and students.
+        
+        Shares its cache entries with ClassCountView and StudentCountView,
+        and reads both in a single cache round trip.
+        
+        Args:
+            request: HTTP request.
+            
+        Returns:
+            Response with class and student counts.
+        """
+        counts: Dict[str, int] = cache.get_many(
+            [CLASS_COUNT_CACHE_KEY, STUDENT_COUNT_CACHE_KEY]
+        )
+        missing: Dict[str, int] = {}
+        if CLASS_COUNT_CACHE_KEY not in counts:
+            missing[CLASS_COUNT_CACHE_KEY] = Class.objects.count()
+        if STUDENT_COUNT_CACHE_KEY not in counts:
+            missing[STUDENT_COUNT_CACHE_KEY] = Student.objects.count()
+        if missing:
+            cache.set_many(missing, COUNT_CACHE_TIMEOUT)
+            counts.update(missing)
+        return Response({
+            "total_classes": counts[CLASS_COUNT_CACHE_KEY],
+            "total_students": counts[STUDENT_COUNT_CACHE_KEY],
+        }, status=status.HTTP_200_OK)
+
+
 class StudentUpdateView(generics.RetrieveUpdateAPIView):
     """
     API View for updating students.
@@ -378,14 +839,40 @@ class StudentDeleteView(generics.DestroyAPIView):
         return super().delete(request, *args, **kwargs)
 
 
+@method_decorator(condition(etag_func=cached_etag(ATTENDANCE_LIST_ETAG_CACHE_KEY)), name="get")
 class AttendanceListView(generics.ListAPIView):
     """
     API View for listing all attendance records.
     """
     
-    queryset = Attendance.objects.all()
+    # Explicit order: with the student joins SQLite otherwise returns rows
+    # grouped by student rather than in insertion order
+    queryset = Attendance.objects.order_by('id')
     serializer_class = AttendanceSerializer
 
+    def get_queryset(self) -> QuerySet[Attendance]:
+        """
+        Return attendance records with the full student graph joined in.
+        """
+        return self.get_serializer_class().setup_eager_loading(
+            super().get_queryset()
+        )
+
+    def list(self, request, *args, **kwargs) -> Response:
+        """
+        List attendance records via the values()-based fast path.
+        
+        Args:
+            request: HTTP request.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
+            
+        Returns:
+            Response with attendance data.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(attendance_list_fast(queryset, request))
+
 
 class AttendanceUpdateView(generics.RetrieveUpdateAPIView):
     """
@@ -397,6 +884,57 @@ class AttendanceUpdateView(generics.RetrieveUpdateAPIView):
     lookup_field: str = "attendance_id"
 
 
+class BulkAttendanceUpdateView(APIView):
+    """
+    API View for recording or correcting many attendance rows at once.
+    """
+    
+    def post(self, request) -> Response:
+        """
+        Upsert a list of attendance rows keyed by (student, date_time).
+        
+        Args:
+            request: HTTP request whose body is a list of
+                {"student", "date_time", "status"} objects.
+            
+        Returns:
+            Response with the number of rows written.
+        """
+        serializer = AttendanceUpsertSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        rows: List[Dict[str, Any]] = serializer.validated_data
+        
+        student_ids: set[int] = {row['student'] for row in rows}
+        known_ids: set[int] = set(
+            Student.objects.filter(user_id__in=student_ids)
+            .values_list('user_id', flat=True)
+        )
+        unknown_ids: set[int] = student_ids - known_ids
+        if unknown_ids:
+            return Response(
+                {"error": f"Unknown student ids: {sorted(unknown_ids)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        Attendance.objects.bulk_create(
+            [
+                Attendance(
+                    student_id=row['student'],
+                    date_time=row['date_time'],
+                    status=row['status']
+                )
+                for row in rows
+            ],
+            update_conflicts=True,
+            unique_fields=['student', 'date_time'],
+            update_fields=['status'],
+            batch_size=ATTENDANCE_UPSERT_BATCH_SIZE
+        )
+        # bulk_create sends no post_save signals
+        cache.delete_many([ATTENDANCE_LIST_ETAG_CACHE_KEY, REPORT_GENERATION_CACHE_KEY])
+        
+        logger.info(f"Bulk attendance upsert: {len(rows)} rows")
+        return Response({"count": len(rows)}, status=status.HTTP_200_OK)
 
 
 
@@ -405,33 +943,95 @@ class RecentAttendanceView(View):
     View for retrieving recent attendance records.
     """
     
-    def get(self, request) -> JsonResponse:
+    def get(self, request) -> HttpResponse:
         """
         Get recent attendance records.
         
+        Rows come straight from values() in their response shape, so no
+        model instances are built.
+        
         Args:
             request: HTTP request.
             
         Returns:
-            JsonResponse with recent attendance data.
+            JSON response with recent attendance data.
         """
-        recent_attendance: List[Attendance] = list(
-            Attendance.objects.order_by("-date_time")[:10]
+        attendance_data: List[Dict[str, Any]] = list(
+            Attendance.objects.order_by("-date_time").values(
+                "id",
+                "status",
+                first_name=F("student__first_name"),
+                last_name=F("student__last_name"),
+                username=F("student__user__username"),
+            )[:10]
         )
+        return orjson_response(attendance_data)
+
+
+def refresh_attendance_trend() -> List[Dict[str, Any]]:
+    """
+    Recompute attendance totals per status and store them in the cache.
+    
+    All statuses are counted in one filtered aggregate pass rather than a
+    GROUP BY; statuses with no rows are left out. Called on a cache miss
+    and periodically by the refresh_attendance_trend Celery task, so
+    polling requests rarely pay for the table scan.
+    
+    Returns:
+        List of {"status", "total"} dictionaries, most frequent first.
+    """
+    totals: Dict[str, int] = Attendance.objects.aggregate(**{
+        status_value: Count("id", filter=Q(status=status_value))
+        for status_value, _label in Attendance.STATUS_CHOICES
+    })
+    trend_data: List[Dict[str, Any]] = sorted(
+        (
+            {"status": status_value, "total": total}
+            for status_value, total in totals.items()
+            if total
+        ),
+        key=lambda row: row["total"],
+        reverse=True
+    )
+    cache.set(ATTENDANCE_TREND_CACHE_KEY, trend_data, ATTENDANCE_TREND_CACHE_TIMEOUT)
+    return trend_data
+
+
+def attendance_trend() -> List[Dict[str, Any]]:
+    """
+    Return attendance totals per status, most frequent first.
+    
+    The scan covers the whole attendance table, so the result is served
+    from the periodically refreshed cache and recomputed only on a miss;
+    it may lag writes by up to ATTENDANCE_TREND_CACHE_TIMEOUT seconds.
+    
+    Returns:
+        List of {"status", "total"} dictionaries.
+    """
+    trend_data: List[Dict[str, Any]] | None = cache.get(ATTENDANCE_TREND_CACHE_KEY)
+    if trend_data is None:
+        trend_data = refresh_attendance_trend()
+    return trend_data
+
+
+def attendance_trend_etag(request, *args, **kwargs) -> str:
+    """
+    Hash the current attendance trend into an ETag.
+    
+    Args:
+        request: HTTP request (unused).
         
-        attendance_data: List[Dict[str, Any]] = []
-        for record in recent_attendance:
-            attendance_data.append({
-                "id": record.id,
-                "status": record.status,
-                "first_name": record.student.first_name,
-                "last_name": record.student.last_name,
-                "username": record.student.user.username
-            })
-            
-        return JsonResponse(attendance_data, safe=False)
+    Returns:
+        Hex digest of the serialized trend.
+    """
+    payload: bytes = json.dumps(attendance_trend(), sort_keys=True).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
 
+@method_decorator(
+    [cache_control(max_age=ATTENDANCE_TREND_MAX_AGE), condition(etag_func=attendance_trend_etag)],
+    name="get"
+)
 class AttendanceTrendView(View):
     """
     View for retrieving attendance trends.
@@ -447,12 +1047,7 @@ class AttendanceTrendView(View):
         Returns:
             JsonResponse with attendance trends.
         """
-        trend_data: List[Dict[str, Any]] = list(
-            Attendance.objects.values("status")
-            .annotate(total=Count("status"))
-            .order_by("-total")
-        )
-        return JsonResponse(trend_data, safe=False)
+        return JsonResponse(attendance_trend(), safe=False)
 
 
 @method_decorator(csrf_exempt, name="dispatch")
@@ -465,7 +1060,7 @@ class DetailedAttendanceReportView(View):
     """
     
     @handle_view_exceptions
-    def post(self, request) -> JsonResponse:
+    def post(self, request) -> HttpResponse:
         """
         Generate detailed attendance report with daily breakdown.
         
@@ -473,84 +1068,80 @@ class DetailedAttendanceReportView(View):
             request: HTTP request with classId, startDate, and endDate.
             
         Returns:
-            JsonResponse with detailed report data.
+            JSON response with detailed report data.
         """
         try:
-            data: Dict[str, Any] = json.loads(request.body)
-            class_id: int | None = data.get("classId")
-            start_date_str: str | None = data.get("startDate")
-            end_date_str: str | None = data.get("endDate")
-
-            if not all([class_id, start_date_str, end_date_str]):
+            params = parse_report_request(request.body)
+            if params is None:
                 return JsonResponse(
                     {"error": "Missing parameters"}, 
                     status=400
                 )
-
-            start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-            end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
+            class_id, start_date, end_date, _data = params
+            
+            cache_key: str = report_cache_key(class_id, start_date, end_date)
+            report: Dict[str, Any] | None = cache.get(cache_key)
+            if report is not None:
+                return orjson_response(report)
             
-            class_obj: Class = Class.objects.get(class_id=class_id)
-            total_students: int = Student.objects.filter(
-                student_class=class_obj
-            ).count()
-
-            # Get all relevant attendance records
-            attendance_records: List[Attendance] = list(
-                Attendance.objects.filter(
-                    student__student_class=class_obj,
-                    date_time__date__range=[start_date, end_date]
-                ).select_related('student')
+            # Roster size is counted in the same query that loads the class
+            class_obj: Class = Class.objects.only("class_id").annotate(
+                student_count=Count("student")
+            ).get(class_id=class_id)
+            total_students: int = class_obj.student_count
+
+            # Present/late counts grouped by day in SQL, so only one row per
+            # day reaches Python
+            range_start, range_end = local_day_range(start_date, end_date)
+            class_attendance: QuerySet[Attendance] = Attendance.objects.filter(
+                student__student_class=class_obj,
+                date_time__gte=range_start,
+                date_time__lt=range_end
             )
-
-            # Daily Breakdown
-            daily_data: Dict[str, Dict[str, Any]] = {}
-            for record in attendance_records:
-                date_str: str = record.date_time.date().isoformat()
-                
-                if date_str not in daily_data:
-                    daily_data[date_str] = {
-                        "present": 0,
-                        "late": 0,
-                        "totalStudents": total_students,
-                    }
-                    
-                if record.status == Attendance.PRESENT:
-                    daily_data[date_str]["present"] += 1
-                elif record.status == Attendance.LATE:
-                    daily_data[date_str]["late"] += 1
-
-            # Calculate daily stats
-            daily_breakdown: List[Dict[str, Any]] = []
-            total_present: int = 0
-            total_late: int = 0
-            total_absent: int = 0
+            status_counts: Dict[str, Count] = {
+                "present": Count("id", filter=Q(status=Attendance.PRESENT)),
+                "late": Count("id", filter=Q(status=Attendance.LATE)),
+            }
             
-            for date_str, data_dict in daily_data.items():
-                absent: int = (
-                    data_dict["totalStudents"] 
-                    - (data_dict["present"] + data_dict["late"])
-                )
-                attendance_rate: float = (
-                    ((data_dict["present"] + data_dict["late"]) 
-                     / data_dict["totalStudents"] * 100)
-                    if data_dict["totalStudents"] else 0
+            daily_rows: List[tuple[date, int, int]] = list(
+                class_attendance.values("date_time__date").annotate(
+                    **status_counts
+                ).order_by("date_time__date").values_list(
+                    "date_time__date", "present", "late"
                 )
-                
-                daily_breakdown.append({
-                    "date": date_str,
-                    "present": data_dict["present"],
-                    "late": data_dict["late"],
-                    "absent": absent,
-                    "attendanceRate": round(attendance_rate, 2),
-                })
+            )
 
-                total_present += data_dict["present"]
-                total_late += data_dict["late"]
-                total_absent += absent
+            # Daily Breakdown: absences and rates for every day at once, as
+            # (days, 2) arrays of [present, late]; total_students is shared.
+            # Rates divide before scaling to 100, as the per-row math did, so
+            # rounded values stay identical
+            day_counts: np.ndarray = np.array(
+                [(present_count, late_count) for _day, present_count, late_count in daily_rows],
+                dtype=np.int64
+            ).reshape(-1, 2)
+            day_attended: np.ndarray = day_counts.sum(axis=1)
+            day_absent: np.ndarray = total_students - day_attended
+            day_rates: List[float] | List[int] = (
+                np.round(day_attended / total_students * 100, 2).tolist()
+                if total_students else [0] * len(daily_rows)
+            )
+            daily_breakdown: List[Dict[str, Any]] = [
+                {
+                    "date": day.isoformat(),
+                    "present": present_count,
+                    "late": late_count,
+                    "absent": absent,
+                    "attendanceRate": rate,
+                }
+                for (day, present_count, late_count), absent, rate in zip(
+                    daily_rows, day_absent.tolist(), day_rates
+                )
+            ]
+            total_present, total_late = day_counts.sum(axis=0).tolist()
+            total_absent: int = int(day_absent.sum())
 
             # Summary Statistics
-            total_days: int = len(daily_data)
+            total_days: int = len(daily_rows)
             total_possible_attendance: int = (
                 total_students * total_days if total_days else 0
             )
@@ -569,49 +1160,50 @@ class DetailedAttendanceReportView(View):
                 "overallAttendanceRate": round(overall_rate, 2),
             }
 
-            # Student-wise Statistics
-            students: List[Student] = list(
-                Student.objects.filter(student_class=class_obj).prefetch_related(
-                    Prefetch(
-                        'attendance_set',
-                        queryset=Attendance.objects.filter(
-                            date_time__date__range=[start_date, end_date]
-                        ),
-                        to_attr='filtered_attendance'
-                    )
-                )
+            # Student-wise Statistics: the roster joined to its in-range
+            # attendance and grouped in SQL, so students without records
+            # still come back with zero counts
+            in_range: Q = Q(
+                attendance__date_time__gte=range_start,
+                attendance__date_time__lt=range_end
+            )
+            students = Student.objects.filter(student_class=class_obj).annotate(
+                present=Count(
+                    "attendance", filter=in_range & Q(attendance__status=Attendance.PRESENT)
+                ),
+                late=Count(
+                    "attendance", filter=in_range & Q(attendance__status=Attendance.LATE)
+                ),
+                name=STUDENT_DISPLAY_NAME,
+            ).order_by("user_id").values_list(
+                "user_id", "name", "present", "late"
             )
 
             student_reports: List[Dict[str, Any]] = []
-            for student in students:
-                present: int = sum(
-                    1 for a in student.filtered_attendance 
-                    if a.status == Attendance.PRESENT
-                )
-                late: int = sum(
-                    1 for a in student.filtered_attendance 
-                    if a.status == Attendance.LATE
-                )
-                absent_days: int = total_days - (present + late)
+            for user_id, name, present, late in students:
+                attended: int = present + late
+                absent_days: int = total_days - attended
                 student_rate: float = (
-                    ((present + late) / total_days * 100) 
+                    (attended / total_days * 100)
                     if total_days else 0
                 )
 
                 student_reports.append({
-                    "id": student.user_id,
-                    "name": f"{student.first_name} {student.last_name}",
+                    "id": user_id,
+                    "name": name,
                     "present": present,
                     "late": late,
                     "absent": absent_days,
                     "attendanceRate": round(student_rate, 2),
                 })
 
-            return JsonResponse({
+            report = {
                 "summary": summary,
                 "dailyBreakdown": daily_breakdown,
                 "students": student_reports,
-            }, safe=False)
+            }
+            cache.set(cache_key, report, REPORT_CACHE_TIMEOUT)
+            return orjson_response(report)
 
         except ValueError:
             logger.warning("Invalid date format in attendance report")
@@ -629,67 +1221,39 @@ class CSVAttendanceExportView(View):
     """
     View for exporting attendance data to CSV file.
     
-    Generates and downloads a CSV file containing attendance records
-    for a specific class within a date range.
+    Streams a CSV (or JSON) file containing attendance records for a
+    specific class within a date range.
     """
     
     @handle_view_exceptions
     def post(self, request) -> HttpResponse:
         """
-        Export attendance data as CSV file.
+        Export attendance data as a streamed CSV file.
         
         Args:
-            request: HTTP request with classId, startDate, and endDate.
+            request: HTTP request with classId, startDate, endDate and an
+                optional format ("json" streams a JSON array instead).
             
         Returns:
-            CSV file response.
+            Streaming CSV (or JSON) file response.
         """
         try:
-            data: Dict[str, Any] = json.loads(request.body)
-            class_id: int | None = data.get("classId")
-            start_date_str: str | None = data.get("startDate")
-            end_date_str: str | None = data.get("endDate")
-
-            if not all([class_id, start_date_str, end_date_str]):
+            params = parse_report_request(request.body)
+            if params is None:
                 return JsonResponse(
                     {"error": "Missing parameters"}, 
                     status=400
                 )
-
-            start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-            end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
+            class_id, start_date, end_date, data = params
             
-            class_obj: Class = Class.objects.get(class_id=class_id)
-            students: List[Student] = list(
-                Student.objects.filter(student_class=class_obj)
-            )
-            attendance_records: List[Attendance] = list(
-                Attendance.objects.filter(
-                    student__in=students,
-                    date_time__date__range=[start_date, end_date]
-                )
-            )
-
-            response: HttpResponse = HttpResponse(content_type="text/csv")
-            response["Content-Disposition"] = (
-                'attachment; filename="attendance_report.csv"'
-            )
-            writer = csv.writer(response)
-            writer.writerow(["Student Name", "Class", "Date", "Status"])
+            # Only the columns str(class_obj) renders into every row
+            class_obj: Class = Class.objects.only(
+                "class_id", "name", "section"
+            ).get(class_id=class_id)
             
-            for record in attendance_records:
-                writer.writerow([
-                    f"{record.student.first_name} {record.student.last_name}",
-                    f"{class_obj.name} - {class_obj.section}",
-                    record.date_time.strftime("%Y-%m-%d"),
-                    record.status
-                ])
-                
-            logger.info(
-                f"Attendance exported: class_id={class_id}, "
-                f"records={len(attendance_records)}"
-            )
-            return response
+            if data.get("format") == "json":
+                return self._stream_json(class_obj, start_date, end_date)
+            return self._stream_csv(class_obj, start_date, end_date)
             
         except Class.DoesNotExist:
             logger.warning(f"Class not found: class_id={class_id}")
@@ -700,3 +1264,125 @@ class CSVAttendanceExportView(View):
         except Exception as e:
             logger.error(f"Attendance export error: {e}")
             raise DatabaseError(f"Database error: {str(e)}")
+
+    def _export_rows(self, class_obj: Class, start_date: date, end_date: date) -> Iterator[tuple]:
+        """
+        Iterate the exported columns for a class and date range.
+        
+        Args:
+            class_obj: The class being exported.
+            start_date: First day of the range (inclusive).
+            end_date: Last day of the range (inclusive).
+            
+        Returns:
+            Iterator of (student_id, day, status) tuples, fetched
+            EXPORT_CHUNK_SIZE rows at a time. The day is the UTC date of
+            the record, truncated by the database; both writers format it
+            with str(), so no per-row formatting happens in the view.
+        """
+        range_start, range_end = local_day_range(start_date, end_date)
+        return Attendance.objects.filter(
+            student__student_class=class_obj,
+            date_time__gte=range_start,
+            date_time__lt=range_end
+        ).order_by("date_time").values_list(
+            "student_id", TruncDate("date_time", tzinfo=timezone.utc), "status"
+        ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+    def _student_names(self, class_obj: Class) -> Dict[int, str]:
+        """
+        Map each student of a class to the name shown in exports.
+        
+        Built once per export so rows only carry the student id.
+        
+        Args:
+            class_obj: The class being exported.
+            
+        Returns:
+            Dictionary of student user_id to "first last".
+        """
+        return dict(
+            Student.objects.filter(student_class=class_obj).values_list(
+                "user_id", STUDENT_DISPLAY_NAME
+            )
+        )
+
+    def _stream_csv(self, class_obj: Class, start_date: date, end_date: date) -> StreamingHttpResponse:
+        """
+        Stream the export as CSV without building the file in memory.
+        
+        Args:
+            class_obj: The class being exported.
+            start_date: First day of the range (inclusive).
+            end_date: Last day of the range (inclusive).
+            
+        Returns:
+            Streaming CSV file response.
+        """
+        class_label: str = str(class_obj)
+        names: Dict[int, str] = self._student_names(class_obj)
+        rows = self._export_rows(class_obj, start_date, end_date)
+        formatted = (
+            (names[student_id], class_label, day, record_status)
+            for student_id, day, record_status in rows
+        )
+        
+        def lines() -> Iterator[str]:
+            # csv's C writer formats a whole batch per call; one chunk is sent per batch
+            buffer: io.StringIO = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(["Student Name", "Class", "Date", "Status"])
+            yield buffer.getvalue()
+            while batch := list(islice(formatted, EXPORT_CHUNK_SIZE)):
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(batch)
+                yield buffer.getvalue()
+        
+        response: StreamingHttpResponse = StreamingHttpResponse(
+            lines(), content_type="text/csv"
+        )
+        response["Content-Disposition"] = (
+            'attachment; filename="attendance_report.csv"'
+        )
+        logger.info(f"Attendance CSV export started: class_id={class_obj.class_id}")
+        return response
+
+    def _stream_json(self, class_obj: Class, start_date: date, end_date: date) -> StreamingHttpResponse:
+        """
+        Stream the export as a JSON array without materializing it.
+        
+        Rows are read with a server-side iterator, so memory stays bounded
+        by EXPORT_CHUNK_SIZE and the first bytes are sent before the whole
+        range has been read.
+        
+        Args:
+            class_obj: The class being exported.
+            start_date: First day of the range (inclusive).
+            end_date: Last day of the range (inclusive).
+            
+        Returns:
+            Streaming JSON file response.
+        """
+        class_label: str = str(class_obj)
+        names: Dict[int, str] = self._student_names(class_obj)
+        rows = self._export_rows(class_obj, start_date, end_date)
+        
+        records = (
+            {
+                "studentName": names[student_id],
+                "class": class_label,
+                "date": day,
+                "status": record_status,
+            }
+            for student_id, day, record_status in rows
+        )
+        
+        response: StreamingHttpResponse = StreamingHttpResponse(
+            stream_json_array(records), content_type="application/json"
+        )
+        response["Content-Disposition"] = (
+            'attachment; filename="attendance_report.json"'
+        )
+        logger.info(f"Attendance JSON export started: class_id={class_obj.class_id}")
+        return response
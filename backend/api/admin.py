@@ -5,6 +5,14 @@ from .models import Student, Attendance, User, Class  # Import your models here
 
 # Register your models here
 admin.site.register(Student)
-admin.site.register(Attendance)
+
+
+class AttendanceAdmin(admin.ModelAdmin):
+    # Rows render as "<student> - <status> on <time>"; join the student
+    # into the changelist query instead of fetching it per row
+    list_select_related = ('student',)
+
+
+admin.site.register(Attendance, AttendanceAdmin)
 admin.site.register(User)
 admin.site.register(Class)
\ No newline at end of file
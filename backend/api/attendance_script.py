@@ -1,7 +1,11 @@
 import random
-from datetime import datetime, timedelta
+from functools import lru_cache
+from datetime import datetime, time, timedelta
+
+import numpy as np
 from django.utils import timezone
 from django.core.files import File
+from django.core.files.storage import default_storage
 from django.contrib.auth.hashers import make_password
 
 from api.models import User, Admin, Class, Student, Attendance
@@ -24,6 +28,15 @@ nepali_names = [
     ("Sarita", "Bala", "Basnet"),
 ]
 
+# One generator for the whole script instead of the shared module-level one;
+# seed it (e.g. random.Random(42)) for reproducible sample data
+rng = random.Random()
+
+@lru_cache(maxsize=None)
+def hashed_password(password):
+    # Seed passwords derive from the name, so each distinct one is hashed once
+    return make_password(password)
+
 def create_classes(admin):
     classes = []
     for sem in range(1, 3):  # two semesters
@@ -41,11 +54,18 @@ def create_classes(admin):
     return classes
 
 def create_students(classes):
-    students_created = 0
+    # Every seeded student shares one stored copy of the sample image
+    try:
+        with open(STUDENT_IMAGE_PATH, 'rb') as img_file:
+            student_img = default_storage.save('student_images/seed_student.jpg', File(img_file))
+    except Exception as e:
+        print(f"Error storing student image: {e}")
+        return
+
+    students = []
     for cls in classes:
-        count = random.randint(30, 50)
-        for _ in range(count):
-            first, middle, last = random.choice(nepali_names)
+        count = rng.randint(30, 50)
+        for first, middle, last in rng.choices(nepali_names, k=count):
             username = (first + last).lower() + '123'
             password = f"{first[0].upper()}{last.lower()}123.@"
 
@@ -53,61 +73,70 @@ def create_students(classes):
                 username=username,
                 defaults={
                     'name': f"{first} {middle} {last}",
-                    'password': make_password(password)
+                    'password': hashed_password(password)
                 }
             )
             if created:
-                try:
-                    with open(STUDENT_IMAGE_PATH, 'rb') as img_file:
-                        django_file = File(img_file)
-                        student = Student(
-                            user=user,
-                            first_name=first,
-                            middle_name=middle,
-                            last_name=last,
-                            student_class=cls,
-                        )
-                        student.student_img.save(f"{username}.jpg", django_file, save=True)
-                    students_created += 1
-                except Exception as e:
-                    print(f"Error creating student image for {username}: {e}")
-    print(f"Created {students_created} new students.", flush=True)
+                students.append(Student(
+                    user=user,
+                    first_name=first,
+                    middle_name=middle,
+                    last_name=last,
+                    student_class=cls,
+                    student_img=student_img,
+                ))
+    Student.objects.bulk_create(students, batch_size=200)
+    print(f"Created {len(students)} new students.", flush=True)
 
 def generate_attendance(months_back=1): # Reduced to 1 month for speed
-    status_choices = ['Present', 'Absent', 'Late']
+    status_choices = [Attendance.PRESENT, Attendance.ABSENT, Attendance.LATE]
     status_weights = [0.8, 0.15, 0.05]
     end_date = timezone.now().date()
     start_date = end_date - timedelta(days=months_back * 30)
-    students = Student.objects.all()
-
-    def daterange(start_date, end_date):
-        for n in range((end_date - start_date).days + 1):
-            day = start_date + timedelta(n)
-            # Only weekdays
-            if day.weekday() < 5:
-                yield day
-
-    attendance_list = []
-    for student in students:
-        for single_date in daterange(start_date, end_date):
-            exists = Attendance.objects.filter(student=student, date_time__date=single_date).exists()
-            if exists:
-                continue
-            hour = random.randint(8, 15)
-            minute = random.randint(0, 59)
-            attendance_datetime = datetime.combine(single_date, datetime.min.time()).replace(hour=hour, minute=minute)
+    students = Student.objects.only('pk')
+
+    # Weekdays of the window, computed once and shared by every student
+    days = np.arange(np.datetime64(start_date), np.datetime64(end_date) + 1)
+    weekdays = days[np.is_busday(days)].tolist()
+
+    # (student, day) pairs that already have a record, loaded in one query;
+    # a plain date_time range (not date_time__date) can use the index
+    existing = set(
+        Attendance.objects.filter(
+            date_time__gte=timezone.make_aware(datetime.combine(start_date, time.min)),
+            date_time__lt=timezone.make_aware(datetime.combine(end_date + timedelta(days=1), time.min)),
+        ).values_list('student_id', 'date_time__date')
+    )
+
+    pairs = [
+        (student.pk, single_date)
+        for student in students
+        for single_date in weekdays
+        if (student.pk, single_date) not in existing
+    ]
+
+    # Draw every check-in time and status in one vectorised call each
+    np_rng = np.random.default_rng(rng.getrandbits(64))
+    n = len(pairs)
+    hours = np_rng.integers(8, 16, n).tolist()
+    minutes = np_rng.integers(0, 60, n).tolist()
+    statuses = np_rng.choice(status_choices, size=n, p=status_weights).tolist()
+
+    attendance_list = [
+        Attendance(
+            student_id=student_id,
+            status=status,
             # Make it aware if settings specify it
-            attendance_datetime = timezone.make_aware(attendance_datetime)
-            
-            status = random.choices(status_choices, weights=status_weights, k=1)[0]
-            attendance_list.append(Attendance(
-                student=student,
-                status=status,
-                date_time=attendance_datetime
-            ))
+            date_time=timezone.make_aware(datetime.combine(single_date, time(hour, minute)))
+        )
+        for (student_id, single_date), hour, minute, status in zip(pairs, hours, minutes, statuses)
+    ]
     
+    # The set above keeps one row per student per day; the (student, date_time)
+    # unique constraint lets the database skip any exact clash, e.g. with a
+    # concurrent run, instead of aborting the whole insert
     if attendance_list:
-        Attendance.objects.bulk_create(attendance_list)
+        Attendance.objects.bulk_create(attendance_list, batch_size=1000, ignore_conflicts=True)
     print(f"Created {len(attendance_list)} attendance records for {students.count()} students.", flush=True)
 
 def run_all():
@@ -118,7 +147,7 @@ def run_all():
         username='admin',
         defaults={
             'name': 'Default Admin',
-            'password': make_password('admin123'),
+            'password': hashed_password('admin123'),
             'is_staff': True,
             'is_superuser': True
         }
@@ -138,13 +167,13 @@ def run_all():
         username='admin',
         defaults={
             'name': 'Default Admin',
-            'password': make_password('admin123'),
+            'password': hashed_password('admin123'),
             'is_staff': True,
             'is_superuser': True
         }
     )
     if not created:
-        admin_app_user.password = make_password('admin123')
+        admin_app_user.password = hashed_password('admin123')
         admin_app_user.save()
     
     classes = create_classes(admin)
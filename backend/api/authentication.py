@@ -0,0 +1,37 @@
+"""
+Shared authentication settings for the College Attendance System.
+
+Student (api) and admin (admin_app) logins sign, verify and reject tokens
+the same way, so the JWT codec and the login failure constants live here
+once instead of in each app's views.
+"""
+
+from datetime import timedelta
+from typing import Any, Dict, List
+
+import jwt
+from django.conf import settings
+
+# JWT signing configuration, resolved once at import
+JWT_ALGORITHMS: List[str] = [settings.JWT_ALGORITHM]
+JWT_LIFETIME: timedelta = timedelta(minutes=60)
+JWT_DECODE_OPTIONS: Dict[str, Any] = {
+    'require': ['exp', 'iat', 'id'],
+    'verify_aud': False,
+    'verify_iss': False,
+}
+
+# Shared codec with the decode options merged in and the HMAC key prepared,
+# so requests skip per-call option merging and key encoding
+JWT_CODEC: jwt.PyJWT = jwt.PyJWT(JWT_DECODE_OPTIONS)
+JWT_KEY: bytes = jwt.get_algorithm_by_name(JWT_ALGORITHMS[0]).prepare_key(
+    settings.JWT_SECRET
+)
+
+# Same failure for unknown users and wrong passwords, so responses do not
+# reveal which usernames exist
+LOGIN_FAILED_MESSAGE: str = 'Incorrect username or password'
+
+# Hashed in place of the submitted password for unknown usernames, so they
+# always cost one full hash, like a wrong password for a real user
+LOGIN_DUMMY_PASSWORD: str = 'login-timing-dummy'
@@ -5,55 +5,122 @@ This module provides a structured exception hierarchy with rich context
 and meaningful error messages following professional coding practices.
 """
 
-from typing import Any, Dict, Optional
+from operator import methodcaller
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 from rest_framework import status
 
 
+def _rebuild_error(
+    cls: type,
+    message: str,
+    status_code: int,
+    details: Dict[str, Any]
+) -> "BaseAttendanceError":
+    """
+    Recreate a pickled error without re-running the subclass constructor.
+    
+    Args:
+        cls: The error class.
+        message: Human-readable error message.
+        status_code: HTTP status code.
+        details: Additional context dictionary.
+        
+    Returns:
+        The restored error instance.
+    """
+    error: BaseAttendanceError = cls.__new__(cls)
+    BaseAttendanceError.__init__(error, message, status_code, details)
+    return error
+
+
 class BaseAttendanceError(Exception):
     """
     Base exception for all attendance system errors.
     
+    Attributes live in __slots__ (subclasses declare empty ones). Exception
+    instances still carry a __dict__, but BaseException only creates it on
+    first use, and nothing here assigns outside the slots. A message given
+    with message_args is a str.format template, rendered on first access
+    so errors that are caught and discarded never format it.
+    
     Attributes:
         message: Human-readable error message.
         status_code: HTTP status code for the error.
         details: Additional context about the error.
     """
     
+    __slots__ = ('_message', '_template', '_message_args', 'status_code', 'details', '_dict')
+    
     def __init__(
         self,
         message: str,
         status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
-        details: Optional[Dict[str, Any]] = None
+        details: Optional[Dict[str, Any]] = None,
+        message_args: Tuple[Any, ...] = ()
     ) -> None:
         """
         Initialize the base attendance error.
         
         Args:
-            message: Human-readable error message.
+            message: Human-readable error message, or a str.format
+                template when message_args is given.
             status_code: HTTP status code (default: 500).
             details: Additional context dictionary.
+            message_args: Positional arguments for the message template.
         """
-        self.message = message
+        self._template = message
+        self._message_args = message_args
+        self._message: Optional[str] = None if message_args else message
         self.status_code = status_code
         self.details = details or {}
-        super().__init__(self.message)
+        self._dict: Optional[Dict[str, Any]] = None
+        if message_args:
+            super().__init__()
+        else:
+            super().__init__(message)
+    
+    @property
+    def message(self) -> str:
+        """Human-readable error message, formatted on first access."""
+        if self._message is None:
+            self._message = self._template.format(*self._message_args)
+            self.args = (self._message,)
+        return self._message
+    
+    @message.setter
+    def message(self, value: str) -> None:
+        self._message = value
+        self.args = (value,)
     
     def __str__(self) -> str:
         """Return string representation of the error."""
         return self.message
     
+    def __repr__(self) -> str:
+        """Return the class name and message, formatting it if still pending."""
+        return f"{type(self).__name__}({self.message!r})"
+    
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle from the slot values; subclass constructors take other arguments."""
+        return (_rebuild_error, (type(self), self.message, self.status_code, self.details))
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert exception to dictionary format.
         
+        The dictionary is built on the first call and reused afterwards,
+        so it does not reflect attributes changed after that call.
+        
         Returns:
             Dictionary representation of the error.
         """
-        return {
-            "error": self.message,
-            "code": self.status_code,
-            "details": self.details
-        }
+        if self._dict is None:
+            self._dict = {
+                "error": self.message,
+                "code": self.status_code,
+                "details": self.details
+            }
+        return self._dict
 
 
 class AuthenticationError(BaseAttendanceError):
@@ -61,6 +128,8 @@ class AuthenticationError(BaseAttendanceError):
     Exception for authentication-related errors.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Authentication failed",
@@ -85,6 +154,8 @@ class ValidationError(BaseAttendanceError):
     Exception for validation-related errors.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Validation failed",
@@ -120,6 +191,8 @@ class NotFoundError(BaseAttendanceError):
     Exception for resource not found errors.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         resource_type: str,
@@ -134,9 +207,11 @@ class NotFoundError(BaseAttendanceError):
             resource_id: ID of the resource that was not found.
             details: Additional context dictionary.
         """
-        message: str = f"{resource_type} not found"
+        message_args: Tuple[Any, ...] = (resource_type,)
+        message: str = "{} not found"
         if resource_id is not None:
-            message += f" (ID: {resource_id})"
+            message_args += (resource_id,)
+            message += " (ID: {})"
         
         error_details: Dict[str, Any] = details or {}
         error_details["resource_type"] = resource_type
@@ -146,7 +221,8 @@ class NotFoundError(BaseAttendanceError):
         super().__init__(
             message=message,
             status_code=status.HTTP_404_NOT_FOUND,
-            details=error_details
+            details=error_details,
+            message_args=message_args
         )
 
 
@@ -155,6 +231,8 @@ class DuplicateEntryError(BaseAttendanceError):
     Exception for duplicate entry errors.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         resource_type: str,
@@ -171,9 +249,7 @@ class DuplicateEntryError(BaseAttendanceError):
             value: Duplicate value.
             details: Additional context dictionary.
         """
-        message: str = (
-            f"{resource_type} with {field}='{value}' already exists"
-        )
+        message: str = "{} with {}='{}' already exists"
         
         error_details: Dict[str, Any] = details or {}
         error_details["resource_type"] = resource_type
@@ -183,7 +259,8 @@ class DuplicateEntryError(BaseAttendanceError):
         super().__init__(
             message=message,
             status_code=status.HTTP_409_CONFLICT,
-            details=error_details
+            details=error_details,
+            message_args=(resource_type, field, value)
         )
 
 
@@ -192,6 +269,8 @@ class PermissionError(BaseAttendanceError):
     Exception for permission/authorization errors.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Permission denied",
@@ -223,6 +302,8 @@ class ImageProcessingError(BaseAttendanceError):
     Exception for image processing errors.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Image processing failed",
@@ -254,6 +335,8 @@ class FaceVerificationError(BaseAttendanceError):
     Exception for face verification errors.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Face verification failed",
@@ -289,6 +372,8 @@ class DatabaseError(BaseAttendanceError):
     Exception for database-related errors.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Database operation failed",
@@ -319,24 +404,68 @@ class DatabaseError(BaseAttendanceError):
         )
 
 
-# Exception handler for Django REST Framework
-def exception_handler(exc: Exception, context: Dict[str, Any]) -> Dict[str, Any]:
+def _generic_error_dict(exc: Exception) -> Dict[str, Any]:
     """
-    Custom exception handler for Django REST Framework.
+    Build the generic 500 response dictionary for a non-attendance error.
     
     Args:
         exc: The exception that was raised.
-        context: Additional context about the request.
         
     Returns:
         Response dictionary with error information.
     """
-    if isinstance(exc, BaseAttendanceError):
-        return exc.to_dict()
-    
-    # Handle other exceptions with a generic response
     return {
         "error": str(exc),
         "code": status.HTTP_500_INTERNAL_SERVER_ERROR,
         "details": {}
     }
+
+
+def _error_classes(cls: type) -> Iterator[type]:
+    """
+    Yield an error class and all of its subclasses.
+    
+    Args:
+        cls: The root error class.
+        
+    Yields:
+        cls followed by every (transitive) subclass.
+    """
+    yield cls
+    for subclass in cls.__subclasses__():
+        yield from _error_classes(subclass)
+
+
+# Calls each error's own to_dict, so subclass overrides are honoured
+_to_dict: Callable[[Exception], Dict[str, Any]] = methodcaller('to_dict')
+
+# Exception type -> dict builder, keyed by the exact type so the handler
+# does a single lookup; types first seen at runtime are resolved once
+_ERROR_HANDLERS: Dict[type, Callable[[Exception], Dict[str, Any]]] = {
+    error_class: _to_dict
+    for error_class in _error_classes(BaseAttendanceError)
+}
+
+
+# Exception handler for Django REST Framework
+def exception_handler(exc: Exception, context: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Custom exception handler for Django REST Framework.
+    
+    Args:
+        exc: The exception that was raised.
+        context: Additional context about the request.
+        
+    Returns:
+        Response dictionary with error information.
+    """
+    exc_type: type = type(exc)
+    handler: Optional[Callable[[Exception], Dict[str, Any]]] = _ERROR_HANDLERS.get(exc_type)
+    if handler is None:
+        handler = (
+            _to_dict
+            if issubclass(exc_type, BaseAttendanceError)
+            else _generic_error_dict
+        )
+        _ERROR_HANDLERS[exc_type] = handler
+    return handler(exc)
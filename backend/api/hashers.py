@@ -0,0 +1,27 @@
+"""
+Password Hashers for the College Attendance System.
+
+This module provides the project's tuned password hasher so the cost
+parameters are set explicitly rather than inherited from Django defaults.
+"""
+
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2 hasher with explicit cost parameters.
+    
+    Hashes keep the standard "argon2" algorithm prefix and encode their
+    parameters, so existing Argon2 hashes still verify and are upgraded
+    on the next successful login if the parameters change.
+    
+    Attributes:
+        time_cost: Number of passes over memory.
+        memory_cost: Memory usage in KiB.
+        parallelism: Number of lanes (threads) used per hash.
+    """
+    
+    time_cost: int = 2
+    memory_cost: int = 64 * 1024
+    parallelism: int = 2
@@ -5,10 +5,45 @@ This module provides centralized logging configuration for the application,
 including formatters, handlers, and loggers for different components.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set
+
+# Level names accepted by setup_logging, resolved without getattr lookups
+_LEVEL_MAP: Dict[str, int] = {
+    'NOTSET': logging.NOTSET,
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARN': logging.WARNING,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'FATAL': logging.CRITICAL,
+    'CRITICAL': logging.CRITICAL,
+}
+
+# Shared formatters; they hold no per-handler state, so one instance each
+# serves every setup_logging call
+_DETAILED_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+)
+_SIMPLE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(levelname)s - %(message)s'
+)
+
+# Log directories already created by this process
+_CREATED_LOG_DIRS: Set[Path] = set()
+
+# Queue between the root logger and the file writer. It outlives each
+# listener, so records logged while setup_logging swaps listeners wait
+# here for the next one instead of being dropped
+_LOG_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+
+# Background thread writing queued records to the log file; replaced by
+# each setup_logging call and stopped by stop_logging
+_LOG_LISTENER: Optional[logging.handlers.QueueListener] = None
 
 
 def setup_logging(
@@ -21,6 +56,10 @@ def setup_logging(
     """
     Set up centralized logging configuration for the application.
 
+    File records are handed to a queue and written by a QueueListener
+    thread, so request threads never block on disk writes or rotation.
+    Console output stays synchronous.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file
@@ -29,57 +68,77 @@ def setup_logging(
         console_logging: Whether to enable console logging
     """
     # Create logs directory if it doesn't exist
-    log_path = Path(log_file)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
+    log_dir = Path(log_file).parent
+    if log_dir not in _CREATED_LOG_DIRS:
+        log_dir.mkdir(parents=True, exist_ok=True)
+        _CREATED_LOG_DIRS.add(log_dir)
 
     # Convert string log level to logging constant
-    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    numeric_level = _LEVEL_MAP.get(log_level.upper(), logging.INFO)
 
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-    )
-
-    simple_formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(message)s'
-    )
+    global _LOG_LISTENER
 
     # Create handlers
     handlers = []
 
-    # File handler with rotation
+    # File handler with rotation, driven from the listener thread
     file_handler = logging.handlers.RotatingFileHandler(
         log_file,
         maxBytes=max_bytes,
         backupCount=backup_count
     )
     file_handler.setLevel(numeric_level)
-    file_handler.setFormatter(detailed_formatter)
-    handlers.append(file_handler)
+    file_handler.setFormatter(_DETAILED_FORMATTER)
+
+    handlers.append(logging.handlers.QueueHandler(_LOG_QUEUE))
 
     # Console handler (optional)
     if console_logging:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(numeric_level)
-        console_handler.setFormatter(simple_formatter)
+        console_handler.setFormatter(_SIMPLE_FORMATTER)
         handlers.append(console_handler)
 
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
 
-    # Remove existing handlers to avoid duplicates
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
-
-    # Add our handlers
-    for handler in handlers:
-        root_logger.addHandler(handler)
+    # Replace the handler list in one assignment rather than removing and
+    # adding in place: threads logging meanwhile iterate either the old list
+    # or the new one, never a half-emptied list that skips handlers
+    root_logger.handlers = handlers
+
+    # Only now hand the queue to the new file handler. The previous listener
+    # writes everything queued before its stop marker; later records stay
+    # queued for the new one
+    stop_logging()
+    _LOG_LISTENER = logging.handlers.QueueListener(
+        _LOG_QUEUE, file_handler, respect_handler_level=True
+    )
+    _LOG_LISTENER.start()
 
     # Configure specific loggers for different modules
     _configure_module_loggers(numeric_level)
 
 
+def stop_logging() -> None:
+    """
+    Flush queued file records and stop the background log writer.
+
+    Safe to call when logging was never set up; also runs at exit.
+    """
+    global _LOG_LISTENER
+
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+        for handler in _LOG_LISTENER.handlers:
+            handler.close()
+        _LOG_LISTENER = None
+
+
+atexit.register(stop_logging)
+
+
 def _configure_module_loggers(level: int) -> None:
     """
     Configure specific loggers for different application modules.
@@ -120,6 +179,10 @@ def get_logger(name: str) -> logging.Logger:
 class AttendanceSystemLogger:
     """
     Custom logger class for attendance system specific logging.
+
+    Messages are passed to the logger as %-style templates with arguments,
+    and the INFO-level helpers return before building anything when INFO
+    is disabled, so filtered-out records cost only a level check.
     """
 
     def __init__(self, name: str):
@@ -134,8 +197,12 @@ class AttendanceSystemLogger:
             path: Request path
             user_id: User ID if authenticated
         """
-        user_info = f" (user_id={user_id})" if user_id else ""
-        self.logger.info(f"Request: {method} {path}{user_info}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        if user_id:
+            self.logger.info("Request: %s %s (user_id=%s)", method, path, user_id)
+        else:
+            self.logger.info("Request: %s %s", method, path)
 
     def log_authentication(self, action: str, username: str, success: bool) -> None:
         """
@@ -146,8 +213,10 @@ class AttendanceSystemLogger:
             username: Username involved
             success: Whether authentication was successful
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         status = "successful" if success else "failed"
-        self.logger.info(f"Authentication {action} {status} for user: {username}")
+        self.logger.info("Authentication %s %s for user: %s", action, status, username)
 
     def log_attendance(self, action: str, student_id: int, status: str) -> None:
         """
@@ -158,7 +227,7 @@ class AttendanceSystemLogger:
             student_id: Student ID
             status: Attendance status
         """
-        self.logger.info(f"Attendance {action}: student_id={student_id}, status={status}")
+        self.logger.info("Attendance %s: student_id=%s, status=%s", action, student_id, status)
 
     def log_error(self, error_type: str, message: str, exc_info: Optional[Exception] = None) -> None:
         """
@@ -169,10 +238,7 @@ class AttendanceSystemLogger:
             message: Error message
             exc_info: Exception information
         """
-        if exc_info:
-            self.logger.error(f"{error_type}: {message}", exc_info=exc_info)
-        else:
-            self.logger.error(f"{error_type}: {message}")
+        self.logger.error("%s: %s", error_type, message, exc_info=exc_info or None)
 
     def log_performance(self, operation: str, duration: float, details: Optional[str] = None) -> None:
         """
@@ -183,8 +249,12 @@ class AttendanceSystemLogger:
             duration: Duration in seconds
             details: Additional details
         """
-        detail_str = f" - {details}" if details else ""
-        self.logger.info(f"Performance: {operation} took {duration:.3f}s{detail_str}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        if details:
+            self.logger.info("Performance: %s took %.3fs - %s", operation, duration, details)
+        else:
+            self.logger.info("Performance: %s took %.3fs", operation, duration)
 
 
 # Global logger instance for convenience
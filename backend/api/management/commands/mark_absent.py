@@ -1,6 +1,11 @@
+from datetime import timedelta
+
+from django.core.cache import cache
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.utils import timezone
 from api.models import Student, Attendance
+from admin_app.cache_keys import ATTENDANCE_LIST_ETAG_CACHE_KEY, REPORT_GENERATION_CACHE_KEY
 
 class Command(BaseCommand):
     help = 'Mark students as absent if they did not verify attendance by the end of the college day'
@@ -10,13 +15,39 @@ class Command(BaseCommand):
         college_end_time = current_time.replace(hour=16, minute=0, second=0, microsecond=0)
         self.stdout.write(self.style.SUCCESS(f'Checking attendance for {current_time}'))
         if current_time >= college_end_time:
-            students = Student.objects.all()
+            # Students with any record today, in one query over today's local range
+            day_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
+            marked_ids = set(
+                Attendance.objects.filter(
+                    date_time__gte=day_start,
+                    date_time__lt=day_start + timedelta(days=1),
+                ).values_list('student_id', flat=True)
+            )
+            students = Student.objects.select_related('user').only('pk', 'user__username')
+            absent_students = []
+            already_marked = []
             for student in students:
-                last_attendance = Attendance.objects.filter(student=student).order_by('-date_time').first()
-                if not last_attendance or last_attendance.date_time.date() != current_time.date():
-                    Attendance.objects.create(status=Attendance.ABSENT, student=student, date_time=current_time)
-                    self.stdout.write(self.style.SUCCESS(f'Marked {student.user.username} as absent'))
+                if student.pk in marked_ids:
+                    already_marked.append(f'{student.user.username} has already verified attendance today')
                 else:
-                    self.stdout.write(self.style.WARNING(f'{student.user.username} has already verified attendance today'))
+                    absent_students.append(student)
+            # One write per block of lines rather than one per student
+            if already_marked:
+                self.stdout.write(self.style.WARNING('\n'.join(already_marked)))
+
+            with transaction.atomic():
+                Attendance.objects.bulk_create(
+                    [
+                        Attendance(status=Attendance.ABSENT, student=student, date_time=current_time)
+                        for student in absent_students
+                    ],
+                    batch_size=1000,
+                )
+            # bulk_create sends no post_save signals
+            cache.delete_many([ATTENDANCE_LIST_ETAG_CACHE_KEY, REPORT_GENERATION_CACHE_KEY])
+            if absent_students:
+                self.stdout.write(self.style.SUCCESS('\n'.join(
+                    f'Marked {student.user.username} as absent' for student in absent_students
+                )))
         else:
-            self.stdout.write(self.style.WARNING('It is not yet the end of the college day'))
\ No newline at end of file
+            self.stdout.write(self.style.WARNING('It is not yet the end of the college day'))
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.24 on 2026-10-15 22:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_attendancemethod_attendance_method_classsession_and_more'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='attendance',
+            constraint=models.UniqueConstraint(fields=('student', 'date_time'), name='attendance_student_time_uniq'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.24 on 2026-10-15 23:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_attendance_date_time_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['student', 'date_time', 'status'], name='attendance_student_time_status'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.24 on 2026-10-15 23:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_attendance_student_time_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['status'], name='attendance_status'),
+        ),
+    ]
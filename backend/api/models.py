@@ -7,6 +7,9 @@ import datetime
 if TYPE_CHECKING:
     from .models import Role, Admin, Class, Student
 
+# Timestamp format used by Attendance.__str__
+ATTENDANCE_STR_TIME_FORMAT: str = '%Y-%m-%d %H:%M:%S'
+
 
 class User(AbstractUser):
     """Custom user model extending Django's AbstractUser."""
@@ -70,8 +73,10 @@ class Attendance(models.Model):
         (ABSENT, 'Absent'),
         (LATE, 'Late'),
     ]
+    # Status labels looked up directly, bypassing get_status_display()
+    STATUS_DISPLAY: dict[str, str] = dict(STATUS_CHOICES)
     status: str = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PRESENT)
-    date_time: datetime.datetime = models.DateTimeField(default=timezone.now)
+    date_time: datetime.datetime = models.DateTimeField(default=timezone.now, db_index=True)
     student: 'Student' = models.ForeignKey(Student, on_delete=models.CASCADE)
     method: Optional['AttendanceMethod'] = models.ForeignKey(
         'AttendanceMethod', 
@@ -81,8 +86,27 @@ class Attendance(models.Model):
         related_name='attendances'
     )
     
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['student', 'date_time'],
+                name='attendance_student_time_uniq'
+            ),
+        ]
+        indexes = [
+            # Covers the report and export scans: student join, date_time
+            # range and status are all answered from the index
+            models.Index(
+                fields=['student', 'date_time', 'status'],
+                name='attendance_student_time_status'
+            ),
+            # Smallest covering index for the whole-table status totals
+            models.Index(fields=['status'], name='attendance_status'),
+        ]
+    
     def __str__(self) -> str:
-        return f"{self.student} - {self.get_status_display()} on {self.date_time.strftime('%Y-%m-%d %H:%M:%S')}"
+        status_label: str = self.STATUS_DISPLAY.get(self.status, self.status)
+        return f"{self.student} - {status_label} on {self.date_time.strftime(ATTENDANCE_STR_TIME_FORMAT)}"
 
 
 class AttendanceMethod(models.Model):
@@ -0,0 +1,54 @@
+"""
+DRF renderers for the Attendance System API.
+
+Provides an orjson-backed JSON renderer used as the project default.
+"""
+
+from typing import Any, Mapping, Optional
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# DRF's encoder, used for types orjson does not know (lazy strings, Decimal, QuerySet, ...)
+_FALLBACK_ENCODER: JSONEncoder = JSONEncoder()
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Render responses as compact UTF-8 JSON using orjson.
+    
+    Output matches rest_framework.renderers.JSONRenderer with its default
+    settings (compact separators, unescaped unicode, non-string dict keys
+    converted to strings); values orjson cannot encode natively are handed
+    to DRF's JSONEncoder.
+    """
+    
+    media_type: str = 'application/json'
+    format: str = 'json'
+    charset: Optional[str] = None
+    
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Mapping[str, Any]] = None
+    ) -> bytes:
+        """
+        Serialize data to JSON bytes.
+        
+        Args:
+            data: The response data.
+            accepted_media_type: The negotiated media type (unused).
+            renderer_context: Renderer context from the view (unused).
+            
+        Returns:
+            The encoded JSON, or an empty body when data is None.
+        """
+        if data is None:
+            return b''
+        return orjson.dumps(
+            data,
+            default=_FALLBACK_ENCODER.default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
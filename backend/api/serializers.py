@@ -13,6 +13,40 @@ from .models import User, Role, Admin, Student, Class, Attendance
 # Type variables for generic serialization
 T = TypeVar('T')
 
+# Allowed attendance statuses and the matching validation message
+VALID_STATUSES: frozenset[str] = frozenset(
+    {Attendance.PRESENT, Attendance.ABSENT, Attendance.LATE}
+)
+VALID_STATUSES_MSG: str = (
+    f"Status must be one of: "
+    f"{', '.join([Attendance.PRESENT, Attendance.ABSENT, Attendance.LATE])}"
+)
+
+# Inclusive bounds for a class's academic year
+MIN_CLASS_YEAR: int = 2000
+MAX_CLASS_YEAR: int = 2100
+CLASS_YEAR_MSG: str = f"Year must be between {MIN_CLASS_YEAR} and {MAX_CLASS_YEAR}"
+
+
+def require_nonempty(value: str, field: str) -> str:
+    """
+    Strip a text value and reject it if nothing is left.
+    
+    Args:
+        value: The raw text value.
+        field: Human-readable field name used in the error message.
+        
+    Returns:
+        The stripped value.
+        
+    Raises:
+        serializers.ValidationError: If the value is empty or whitespace only.
+    """
+    stripped: str = value.strip() if value else ''
+    if not stripped:
+        raise serializers.ValidationError(f"{field} cannot be empty")
+    return stripped
+
 
 class RoleSerializer(serializers.ModelSerializer[Role]):
     """
@@ -31,7 +65,7 @@ class RoleSerializer(serializers.ModelSerializer[Role]):
             fields: Fields to include in the serialization
         """
         model: Type[Role] = Role
-        fields: list[str] = ['id', 'name']
+        fields: tuple[str, ...] = ('id', 'name')
 
 
 class UserSerializer(serializers.ModelSerializer[User]):
@@ -52,7 +86,7 @@ class UserSerializer(serializers.ModelSerializer[User]):
             extra_kwargs: Additional field options (password write-only)
         """
         model: Type[User] = User
-        fields: list[str] = ['id', 'name', 'username', 'password']
+        fields: tuple[str, ...] = ('id', 'name', 'username', 'password')
         extra_kwargs: Dict[str, Dict[str, bool]] = {'password': {'write_only': True}}
 
     def create(self, validated_data: Dict[str, Any]) -> User:
@@ -123,7 +157,7 @@ class AdminSerializer(serializers.ModelSerializer[Admin]):
             fields: Fields to include in the serialization
         """
         model: Type[Admin] = Admin
-        fields: list[str] = ['user', 'role', 'first_name', 'last_name']
+        fields: tuple[str, ...] = ('user', 'role', 'first_name', 'last_name')
 
     def create(self, validated_data: Dict[str, Any]) -> Admin:
         """
@@ -176,7 +210,7 @@ class ClassSerializer(serializers.ModelSerializer[Class]):
             fields: Fields to include in the serialization
         """
         model: Type[Class] = Class
-        fields: list[str] = ['class_id', 'name', 'section', 'semester', 'year']
+        fields: tuple[str, ...] = ('class_id', 'name', 'section', 'semester', 'year')
 
     def validate_name(self, value: str) -> str:
         """
@@ -191,9 +225,7 @@ class ClassSerializer(serializers.ModelSerializer[Class]):
         Raises:
             serializers.ValidationError: If name is empty.
         """
-        if not value or not value.strip():
-            raise serializers.ValidationError("Class name cannot be empty")
-        return value.strip()
+        return require_nonempty(value, "Class name")
 
     def validate_year(self, value: int) -> int:
         """
@@ -208,8 +240,8 @@ class ClassSerializer(serializers.ModelSerializer[Class]):
         Raises:
             serializers.ValidationError: If year is invalid.
         """
-        if value < 2000 or value > 2100:
-            raise serializers.ValidationError("Year must be between 2000 and 2100")
+        if not MIN_CLASS_YEAR <= value <= MAX_CLASS_YEAR:
+            raise serializers.ValidationError(CLASS_YEAR_MSG)
         return value
 
 
@@ -233,10 +265,10 @@ class StudentSerializer(serializers.ModelSerializer[Student]):
             fields: Fields to include in the serialization
         """
         model: Type[Student] = Student
-        fields: list[str] = [
+        fields: tuple[str, ...] = (
             'user', 'first_name', 'middle_name', 'last_name', 
             'student_class', 'student_img'
-        ]
+        )
 
     def create(self, validated_data: Dict[str, Any]) -> Student:
         """
@@ -291,9 +323,7 @@ class StudentSerializer(serializers.ModelSerializer[Student]):
         Raises:
             serializers.ValidationError: If first name is empty.
         """
-        if not value or not value.strip():
-            raise serializers.ValidationError("First name cannot be empty")
-        return value.strip()
+        return require_nonempty(value, "First name")
 
     def validate_last_name(self, value: str) -> str:
         """
@@ -308,9 +338,7 @@ class StudentSerializer(serializers.ModelSerializer[Student]):
         Raises:
             serializers.ValidationError: If last name is empty.
         """
-        if not value or not value.strip():
-            raise serializers.ValidationError("Last name cannot be empty")
-        return value.strip()
+        return require_nonempty(value, "Last name")
 
 
 class AttendanceSerializer(serializers.ModelSerializer[Attendance]):
@@ -331,7 +359,7 @@ class AttendanceSerializer(serializers.ModelSerializer[Attendance]):
             fields: Fields to include in the serialization
         """
         model: Type[Attendance] = Attendance
-        fields: list[str] = ['id', 'student', 'status', 'date_time']
+        fields: tuple[str, ...] = ('id', 'student', 'status', 'date_time')
 
     def validate_status(self, value: str) -> str:
         """
@@ -346,12 +374,8 @@ class AttendanceSerializer(serializers.ModelSerializer[Attendance]):
         Raises:
             serializers.ValidationError: If status is invalid.
         """
-        valid_statuses: list[str] = [Attendance.PRESENT, Attendance.ABSENT, Attendance.LATE]
-        
-        if value not in valid_statuses:
-            raise serializers.ValidationError(
-                f"Status must be one of: {', '.join(valid_statuses)}"
-            )
+        if value not in VALID_STATUSES:
+            raise serializers.ValidationError(VALID_STATUSES_MSG)
         return value
 
     def create(self, validated_data: Dict[str, Any]) -> Attendance:
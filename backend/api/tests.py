@@ -1,3 +1,465 @@
-from django.test import TestCase
+"""
+Tests for the API application.
 
-# Create your tests here.
+Cover the orjson renderer, date validation, the exception hierarchy, the
+student login, current-user and dashboard endpoints, and the mark_absent
+command.
+"""
+
+import io
+import pickle
+import zoneinfo
+from datetime import date, datetime, timedelta, timezone
+from typing import List
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from admin_app.cache_keys import ATTENDANCE_LIST_ETAG_CACHE_KEY, REPORT_GENERATION_CACHE_KEY
+from .authentication import (
+    JWT_ALGORITHMS,
+    JWT_CODEC,
+    JWT_KEY,
+    JWT_LIFETIME,
+    LOGIN_FAILED_MESSAGE,
+)
+from .exceptions import DuplicateEntryError, NotFoundError, exception_handler
+from .models import Admin, Attendance, Class, Role, Student, User
+from .renderers import ORJSONRenderer
+from .validators import parse_iso_date, validate_date_range
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """
+    Tests that ORJSONRenderer matches DRF's JSONRenderer.
+    """
+
+    def test_matches_json_renderer(self) -> None:
+        """Nested payloads, unicode and non-string keys render identically."""
+        data = {
+            'name': 'Sita Magar ✓',
+            'rates': [57.14, 100, 0],
+            1: 'int key',
+            None: 'none key',
+            'nested': {2.5: True},
+        }
+
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_none_renders_empty_body(self) -> None:
+        """A None payload renders as an empty body."""
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+
+class DateValidationTests(SimpleTestCase):
+    """
+    Tests for ISO date parsing and range validation.
+    """
+
+    def test_parses_padded_and_unpadded_dates(self) -> None:
+        """Both 2025-01-06 and 2025-1-6 parse, as with strptime('%Y-%m-%d')."""
+        self.assertEqual(parse_iso_date('2025-01-06'), date(2025, 1, 6))
+        self.assertEqual(parse_iso_date('2025-1-6'), date(2025, 1, 6))
+
+    def test_rejects_non_strptime_forms(self) -> None:
+        """Forms only date.fromisoformat accepts are still rejected."""
+        for value in ('20250106', '2025-01-06T00:00', '2025-W02-1', '2025-13-01'):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                parse_iso_date(value)
+
+    def test_validate_date_range(self) -> None:
+        """Ranges must parse and run forwards."""
+        self.assertEqual(validate_date_range('2025-1-6', '2025-01-07'), (True, None))
+        self.assertEqual(
+            validate_date_range('2025-01-07', '2025-01-06'),
+            (False, 'Start date must be before end date')
+        )
+        self.assertEqual(
+            validate_date_range('20250106', '2025-01-07'), (False, 'Invalid date format')
+        )
+        self.assertEqual(
+            validate_date_range('06/01/2025', '07/01/2025', '%d/%m/%Y'), (True, None)
+        )
+
+
+class _TaggedNotFoundError(NotFoundError):
+    """NotFoundError whose to_dict override marks its output."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> dict:
+        return {**super().to_dict(), 'details': {'tagged': True}}
+
+
+class ExceptionTests(SimpleTestCase):
+    """
+    Tests for the attendance error hierarchy.
+    """
+
+    def test_lazy_message(self) -> None:
+        """Templated messages render on access with their arguments."""
+        self.assertEqual(str(NotFoundError('Student', 7)), 'Student not found (ID: 7)')
+        self.assertEqual(str(NotFoundError('Class')), 'Class not found')
+        self.assertEqual(
+            DuplicateEntryError('User', 'username', 'sita').message,
+            "User with username='sita' already exists"
+        )
+
+    def test_repr_and_args_show_message(self) -> None:
+        """Templated errors report their message in repr and, once formatted, args."""
+        error = NotFoundError('Student', 7)
+
+        self.assertEqual(repr(error), "NotFoundError('Student not found (ID: 7)')")
+        self.assertEqual(error.args, ('Student not found (ID: 7)',))
+
+    def test_pickle_round_trip(self) -> None:
+        """Errors survive pickling with message, status and details intact."""
+        error = pickle.loads(pickle.dumps(NotFoundError('Student', 7)))
+
+        self.assertIsInstance(error, NotFoundError)
+        self.assertEqual(error.to_dict(), {
+            'error': 'Student not found (ID: 7)',
+            'code': status.HTTP_404_NOT_FOUND,
+            'details': {'resource_type': 'Student', 'resource_id': '7'},
+        })
+
+    def test_exception_handler(self) -> None:
+        """Attendance errors use their own to_dict; anything else becomes a generic 500."""
+        self.assertEqual(
+            exception_handler(NotFoundError('Class'), {})['code'], status.HTTP_404_NOT_FOUND
+        )
+        self.assertEqual(
+            exception_handler(_TaggedNotFoundError('Class'), {})['details'], {'tagged': True}
+        )
+        self.assertEqual(exception_handler(KeyError('boom'), {}), {
+            'error': "'boom'",
+            'code': status.HTTP_500_INTERNAL_SERVER_ERROR,
+            'details': {},
+        })
+
+
+class LoginViewTests(APITestCase):
+    """
+    Tests for student login.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user: User = User(username='sita', name='Sita')
+        cls.user.set_password('Passw0rd!')
+        cls.user.save()
+
+    def login(self, **body: str):
+        """
+        POST credentials to the login endpoint.
+
+        Args:
+            **body: Request fields.
+
+        Returns:
+            The test client response.
+        """
+        return self.client.post('/api/login', body, format='json')
+
+    def test_success_sets_cookie(self) -> None:
+        """Correct credentials return the user and set the jwt cookie."""
+        response = self.login(username='sita', password='Passw0rd!')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['username'], 'sita')
+        self.assertIn('jwt', response.cookies)
+
+    def test_failures_are_indistinguishable(self) -> None:
+        """Wrong passwords, unknown users and missing passwords fail the same way."""
+        attempts = {
+            'wrong password': {'username': 'sita', 'password': 'nope'},
+            'unknown user': {'username': 'ghost', 'password': 'nope'},
+            'missing password': {'username': 'sita'},
+            'unknown user, missing password': {'username': 'ghost'},
+        }
+        for label, body in attempts.items():
+            with self.subTest(label):
+                response = self.login(**body)
+                self.assertIn(
+                    response.status_code,
+                    (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+                )
+                self.assertEqual(response.json(), {'detail': LOGIN_FAILED_MESSAGE})
+                self.assertNotIn('jwt', response.cookies)
+
+
+class UserViewTests(APITestCase):
+    """
+    Tests for resolving the jwt cookie to the current student.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user: User = User.objects.create(username='sita', name='Sita')
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def get_user(self, payload: dict):
+        """
+        GET the current user with a cookie signed over ``payload``.
+
+        Args:
+            payload: Claims to sign into the jwt cookie.
+
+        Returns:
+            The test client response.
+        """
+        self.client.cookies['jwt'] = JWT_CODEC.encode(
+            payload, JWT_KEY, algorithm=JWT_ALGORITHMS[0]
+        )
+        return self.client.get('/api/user')
+
+    def test_valid_token_returns_user(self) -> None:
+        """A token with every required claim resolves to its user."""
+        now = datetime.now(timezone.utc)
+        response = self.get_user(
+            {'id': self.user.id, 'exp': now + JWT_LIFETIME, 'iat': now}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['username'], 'sita')
+
+    def test_missing_claims_are_rejected(self) -> None:
+        """Tokens without exp or iat are unauthenticated rather than a 500."""
+        now = datetime.now(timezone.utc)
+        for payload in ({'id': self.user.id}, {'id': self.user.id, 'iat': now}):
+            with self.subTest(claims=sorted(payload)):
+                response = self.get_user(payload)
+                self.assertIn(
+                    response.status_code,
+                    (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+                )
+
+
+class StudentDashboardViewTests(APITestCase):
+    """
+    Tests for the student dashboard payload.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        admin: Admin = Admin.objects.create(
+            user=User.objects.create(username='teacher', name='Teacher'),
+            role=Role.objects.create(name='Admin'),
+            first_name='Tea',
+            last_name='Cher',
+        )
+        cls.klass: Class = Class.objects.create(
+            name='CompSci', section='A', semester='1', year=2025, admin=admin
+        )
+        cls.student, cls.classmate, cls.absentee = [
+            Student.objects.create(
+                user=User.objects.create(username=username, name=username.title()),
+                first_name=username.title(),
+                middle_name=middle_name,
+                last_name='Magar',
+                student_class=cls.klass,
+                student_img='student_images/student.jpg',
+            )
+            for username, middle_name in (('sita', 'Kumari'), ('gita', None), ('rita', None))
+        ]
+        start: datetime = datetime(2025, 1, 1, 4, 0, tzinfo=timezone.utc)
+        statuses: List[str] = [
+            Attendance.PRESENT, Attendance.PRESENT, Attendance.LATE, Attendance.ABSENT,
+            Attendance.PRESENT, Attendance.LATE, Attendance.PRESENT, Attendance.ABSENT,
+        ]
+        for day, record_status in enumerate(statuses):
+            when: datetime = start + timedelta(days=day)
+            Attendance.objects.create(student=cls.student, date_time=when, status=record_status)
+            Attendance.objects.create(
+                student=cls.classmate, date_time=when, status=Attendance.PRESENT
+            )
+
+    def dashboard(self, student: Student):
+        """
+        GET a student's dashboard.
+
+        Args:
+            student: The student to fetch.
+
+        Returns:
+            The test client response.
+        """
+        return self.client.get(f'/api/student_dashboard/{student.pk}/')
+
+    def test_dashboard_payload(self) -> None:
+        """Totals, recent rows, trend and rank match the fixture records."""
+        response = self.dashboard(self.student)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {
+            'id': self.student.pk,
+            'first_name': 'Sita',
+            'middle_name': 'Kumari',
+            'last_name': 'Magar',
+            'student_img': self.student.student_img.url,
+            'student_class': {'name': 'CompSci', 'section': 'A', 'semester': '1', 'year': 2025},
+            'attendance': {
+                'overall_percentage': 50.0,
+                'total_present': 4,
+                'total_absent': 2,
+                'total_late': 2,
+                'breakdown': [
+                    {'name': 'Present', 'value': 4},
+                    {'name': 'Absent', 'value': 2},
+                    {'name': 'Late', 'value': 2},
+                ],
+            },
+            'recent_attendance': [
+                {'date': '2025-01-08', 'status': Attendance.ABSENT},
+                {'date': '2025-01-07', 'status': Attendance.PRESENT},
+                {'date': '2025-01-06', 'status': Attendance.LATE},
+                {'date': '2025-01-05', 'status': Attendance.PRESENT},
+                {'date': '2025-01-04', 'status': Attendance.ABSENT},
+            ],
+            'attendance_trend': [
+                {'date': '2025-01-08', 'attendance': 0},
+                {'date': '2025-01-07', 'attendance': 1},
+                {'date': '2025-01-06', 'attendance': 0.5},
+                {'date': '2025-01-05', 'attendance': 1},
+                {'date': '2025-01-04', 'attendance': 0},
+                {'date': '2025-01-03', 'attendance': 0.5},
+                {'date': '2025-01-02', 'attendance': 1},
+            ],
+            'class_ranking': {'rank': 2, 'total': 3},
+            # 04:00 UTC is 09:45 in Asia/Kathmandu
+            'last_check_in': '2025-01-08 09:45 AM',
+        })
+
+    def test_student_without_records(self) -> None:
+        """A student with no attendance gets zeros, empty lists and the last rank."""
+        response = self.dashboard(self.absentee)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data['middle_name'], '')
+        self.assertEqual(data['attendance'], {
+            'overall_percentage': 0,
+            'total_present': 0,
+            'total_absent': 0,
+            'total_late': 0,
+            'breakdown': [
+                {'name': 'Present', 'value': 0},
+                {'name': 'Absent', 'value': 0},
+                {'name': 'Late', 'value': 0},
+            ],
+        })
+        self.assertEqual(data['recent_attendance'], [])
+        self.assertEqual(data['attendance_trend'], [])
+        self.assertEqual(data['class_ranking'], {'rank': 3, 'total': 3})
+        self.assertEqual(data['last_check_in'], 'N/A')
+
+    def test_unknown_student(self) -> None:
+        """A user id without a student row is a 404."""
+        self.assertEqual(
+            self.client.get('/api/student_dashboard/999999/').status_code,
+            status.HTTP_404_NOT_FOUND
+        )
+
+
+class MarkAbsentCommandTests(TestCase):
+    """
+    Tests for the mark_absent management command.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        admin: Admin = Admin.objects.create(
+            user=User.objects.create(username='teacher', name='Teacher'),
+            role=Role.objects.create(name='Admin'),
+            first_name='Tea',
+            last_name='Cher',
+        )
+        klass: Class = Class.objects.create(
+            name='CompSci', section='A', semester='1', year=2025, admin=admin
+        )
+        cls.students: List[Student] = [
+            Student.objects.create(
+                user=User.objects.create(username=f'student{i}', name=f'Student {i}'),
+                first_name=f'First{i}',
+                last_name=f'Last{i}',
+                student_class=klass,
+                student_img='student_images/student.jpg',
+            )
+            for i in range(4)
+        ]
+        tz = zoneinfo.ZoneInfo('Asia/Kathmandu')
+        cls.now: datetime = datetime(2025, 1, 6, 17, 0, tzinfo=tz)
+        for student, when in [
+            (cls.students[1], datetime(2025, 1, 6, 9, 0, tzinfo=tz)),
+            # Still the local day, though the previous day in UTC
+            (cls.students[2], datetime(2025, 1, 6, 1, 0, tzinfo=tz)),
+            # Yesterday does not count
+            (cls.students[3], datetime(2025, 1, 5, 9, 0, tzinfo=tz)),
+        ]:
+            Attendance.objects.create(student=student, date_time=when, status=Attendance.PRESENT)
+
+    def run_command(self, now: datetime) -> str:
+        """
+        Run mark_absent with the clock set to ``now``.
+
+        Args:
+            now: The time the command sees.
+
+        Returns:
+            The command's output.
+        """
+        out = io.StringIO()
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            call_command('mark_absent', stdout=out)
+        return out.getvalue()
+
+    def absentees(self) -> List[str]:
+        """Return the usernames with an Absent record, sorted."""
+        return sorted(
+            Attendance.objects.filter(status=Attendance.ABSENT)
+            .values_list('student__user__username', flat=True)
+        )
+
+    def test_marks_students_without_a_record_today(self) -> None:
+        """Only students with no record on the local day are marked, once each, at run time."""
+        cache.set(ATTENDANCE_LIST_ETAG_CACHE_KEY, 'stale')
+        cache.set(REPORT_GENERATION_CACHE_KEY, 1)
+
+        output: str = self.run_command(self.now)
+
+        self.assertEqual(self.absentees(), ['student0', 'student3'])
+        self.assertEqual(
+            set(Attendance.objects.filter(status=Attendance.ABSENT).values_list('date_time', flat=True)),
+            {self.now}
+        )
+        for line in (
+            'student1 has already verified attendance today',
+            'student2 has already verified attendance today',
+            'Marked student0 as absent',
+            'Marked student3 as absent',
+        ):
+            self.assertIn(line, output)
+        self.assertIsNone(cache.get(ATTENDANCE_LIST_ETAG_CACHE_KEY))
+        self.assertIsNone(cache.get(REPORT_GENERATION_CACHE_KEY))
+
+    def test_second_run_marks_nobody(self) -> None:
+        """Absences written by a first run count as today's record."""
+        self.run_command(self.now)
+        output: str = self.run_command(self.now + timedelta(hours=1))
+
+        self.assertEqual(self.absentees(), ['student0', 'student3'])
+        self.assertNotIn('Marked', output)
+
+    def test_before_end_of_day(self) -> None:
+        """Before 16:00 local time nothing is written."""
+        output: str = self.run_command(self.now.replace(hour=15, minute=59))
+
+        self.assertEqual(self.absentees(), [])
+        self.assertIn('It is not yet the end of the college day', output)
@@ -6,8 +6,16 @@ validation across the application.
 """
 
 import re
+from datetime import date, datetime
 from typing import Optional, Tuple
 
+# Default format of validate_date_range
+ISO_DATE_FORMAT: str = "%Y-%m-%d"
+
+# Zero-padded YYYY-MM-DD, the only input date.fromisoformat and
+# strptime(ISO_DATE_FORMAT) are guaranteed to agree on
+_PADDED_ISO_DATE: re.Pattern[str] = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
 
 def validate_email(email: str) -> Tuple[bool, Optional[str]]:
     """
@@ -111,14 +119,39 @@ def validate_name(name: str, field_name: str = "Name") -> Tuple[bool, Optional[s
     return True, None
 
 
+def parse_iso_date(value: str) -> date:
+    """
+    Parse a date in ISO_DATE_FORMAT.
+
+    Zero-padded dates take the fast date.fromisoformat path; anything else
+    goes through strptime, so inputs such as "2025-1-6" are still accepted
+    and fromisoformat-only forms such as "20250106" are still rejected.
+
+    Args:
+        value: Date string.
+
+    Returns:
+        The parsed date.
+
+    Raises:
+        ValueError: If the value is not a valid date in ISO_DATE_FORMAT.
+    """
+    if _PADDED_ISO_DATE.fullmatch(value):
+        return date.fromisoformat(value)
+    return datetime.strptime(value, ISO_DATE_FORMAT).date()
+
+
 def validate_date_range(
     start_date: str,
     end_date: str,
-    date_format: str = "%Y-%m-%d"
+    date_format: str = ISO_DATE_FORMAT
 ) -> Tuple[bool, Optional[str]]:
     """
     Validate date range.
 
+    ISO dates (the default format) are parsed with parse_iso_date;
+    other formats use strptime.
+
     Args:
         start_date: Start date string.
         end_date: End date string.
@@ -128,10 +161,14 @@ def validate_date_range(
         Tuple of (is_valid, error_message).
     """
     try:
-        from datetime import datetime
-
-        start = datetime.strptime(start_date, date_format)
-        end = datetime.strptime(end_date, date_format)
+        start: date
+        end: date
+        if date_format == ISO_DATE_FORMAT:
+            start = parse_iso_date(start_date)
+            end = parse_iso_date(end_date)
+        else:
+            start = datetime.strptime(start_date, date_format).date()
+            end = datetime.strptime(end_date, date_format).date()
 
         if start > end:
             return False, "Start date must be before end date"
@@ -9,17 +9,20 @@ comprehensive error handling, and follows professional coding practices.
 import os
 import json
 import base64
+import hashlib
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List, TypeVar
 
 # Third-party libraries
-import jwt
+from jwt import ExpiredSignatureError, InvalidTokenError
 import cv2
 import numpy as np
 import face_recognition
 
 # Django imports
+from django.core.cache import cache
+from django.db.models import Count, Q
 from django.http import JsonResponse, HttpRequest
 from django.shortcuts import get_object_or_404
 from django.views import View
@@ -35,6 +38,14 @@ from rest_framework.response import Response
 from rest_framework.exceptions import AuthenticationFailed
 
 # Local app imports
+from .authentication import (
+    JWT_ALGORITHMS,
+    JWT_CODEC,
+    JWT_KEY,
+    JWT_LIFETIME,
+    LOGIN_DUMMY_PASSWORD,
+    LOGIN_FAILED_MESSAGE,
+)
 from .models import User, Role, Admin, Student, Class, Attendance
 from .serializers import (
     UserSerializer, 
@@ -51,6 +62,25 @@ logger: logging.Logger = logging.getLogger(__name__)
 # Type variable for generic view responses
 V = TypeVar('V')
 
+# Serialized UserView payload per JWT, keyed by a digest of the token;
+# entries never outlive the token and LogoutView deletes them
+USER_CACHE_PREFIX: str = 'api:user:'
+USER_CACHE_TIMEOUT: int = 300
+
+
+def user_cache_key(token: str) -> str:
+    """
+    Build the UserView cache key for a JWT without storing the token itself.
+    
+    Args:
+        token: The raw JWT from the request cookie.
+        
+    Returns:
+        Cache key derived from a blake2b digest of the token.
+    """
+    digest: str = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+    return f"{USER_CACHE_PREFIX}{digest}"
+
 
 class RegisterView(APIView):
     """
@@ -143,25 +173,35 @@ class LoginView(APIView):
         """
         username: str | None = request.data.get('username')
         password: str | None = request.data.get('password')
+        if not password:
+            # Rejected before the lookup, so known and unknown users alike skip hashing
+            logger.warning(f"Login attempt without a password for: {username}")
+            raise AuthenticationFailed(LOGIN_FAILED_MESSAGE)
         
-        user: User | None = User.objects.filter(username=username).first()
+        user: User | None = User.objects.only(
+            'id', 'username', 'password'
+        ).filter(username=username).first()
         
         if user is None:
+            # Hash anyway so unknown usernames take as long as wrong passwords
+            User().set_password(LOGIN_DUMMY_PASSWORD)
             logger.warning(f"Login attempt for non-existent user: {username}")
-            raise AuthenticationFailed('User not found')
+            raise AuthenticationFailed(LOGIN_FAILED_MESSAGE)
             
         if not user.check_password(password):
             logger.warning(f"Invalid password attempt for user: {username}")
-            raise AuthenticationFailed('Incorrect password')
+            raise AuthenticationFailed(LOGIN_FAILED_MESSAGE)
         
         # Generate JWT token
+        now: datetime = datetime.now(timezone.utc)
+        expires: datetime = now + JWT_LIFETIME
         payload: Dict[str, Any] = {
             'id': user.id,
-            'exp': datetime.now(timezone.utc) + timedelta(minutes=60),
-            'iat': datetime.now(timezone.utc)
+            'exp': expires,
+            'iat': now
         }
         
-        token: str = jwt.encode(payload, 'secret', algorithm='HS256')
+        token: str = JWT_CODEC.encode(payload, JWT_KEY, algorithm=JWT_ALGORITHMS[0])
         
         response: Response = Response()
         response.set_cookie(
@@ -170,7 +210,7 @@ class LoginView(APIView):
             httponly=True, 
             samesite='Lax', 
             secure=True, 
-            expires=datetime.now(timezone.utc) + timedelta(minutes=60)
+            expires=expires
         )
         
         response.data: Dict[str, Any] = {
@@ -194,6 +234,10 @@ class UserView(APIView):
         """
         Retrieve current authenticated user's information.
         
+        A validated token's payload is cached until the token expires (at
+        most USER_CACHE_TIMEOUT seconds), so repeat calls skip both
+        signature verification and the user lookup.
+        
         Args:
             request: HTTP request with JWT token.
             
@@ -209,23 +253,34 @@ class UserView(APIView):
             logger.warning("Authentication attempt without token")
             raise AuthenticationFailed('Unauthenticated')
 
+        cache_key: str = user_cache_key(token)
+        user_data: Dict[str, Any] | None = cache.get(cache_key)
+        if user_data is not None:
+            return Response(user_data)
+
         try:
-            payload: Dict[str, Any] = jwt.decode(token, 'secret', algorithms=['HS256'])
-        except jwt.ExpiredSignatureError:
+            payload: Dict[str, Any] = JWT_CODEC.decode(token, JWT_KEY, algorithms=JWT_ALGORITHMS)
+        except ExpiredSignatureError:
             logger.warning("JWT token expired")
             raise AuthenticationFailed('Unauthenticated')
-        except jwt.InvalidTokenError as e:
+        except InvalidTokenError as e:
             logger.warning(f"Invalid JWT token: {e}")
             raise AuthenticationFailed('Unauthenticated')
 
-        user: User | None = User.objects.filter(id=payload['id']).first()
+        user: User | None = User.objects.only(
+            'id', 'name', 'username'
+        ).filter(id=payload['id']).first()
         
         if not user:
             logger.warning(f"User not found for token payload: {payload.get('id')}")
             raise AuthenticationFailed('Unauthenticated')
 
-        serializer = UserSerializer(user)
-        return Response(serializer.data)
+        user_data = dict(UserSerializer(user).data)
+        
+        seconds_left: int = int(payload['exp'] - datetime.now(timezone.utc).timestamp())
+        if seconds_left > 0:
+            cache.set(cache_key, user_data, min(USER_CACHE_TIMEOUT, seconds_left))
+        return Response(user_data)
         
         
 class LogoutView(APIView):
@@ -237,7 +292,7 @@ class LogoutView(APIView):
     
     def post(self, request: HttpRequest) -> Response:
         """
-        Logout user by clearing JWT cookie.
+        Logout user by clearing JWT cookie and its cached user payload.
         
         Args:
             request: HTTP request.
@@ -245,6 +300,10 @@ class LogoutView(APIView):
         Returns:
             Response with logout confirmation.
         """
+        token: str | None = request.COOKIES.get('jwt')
+        if token:
+            cache.delete(user_cache_key(token))
+        
         response: Response = Response()
         response.delete_cookie('jwt')
         response.data = {'message': 'success'}
@@ -269,16 +328,39 @@ class StudentDashboardView(APIView):
         Returns:
             Response with dashboard data including attendance statistics.
         """
-        student: Student = get_object_or_404(Student, user_id=user_id)
+        student: Student = get_object_or_404(
+            Student.objects.select_related('student_class').only(
+                'user_id', 'first_name', 'middle_name', 'last_name', 'student_img',
+                'student_class__name', 'student_class__section',
+                'student_class__semester', 'student_class__year',
+            ),
+            user_id=user_id
+        )
         student_class: Class = student.student_class
         
+        # Only the newest week feeds the recent list, trend and last check-in
         attendance_records: List[Attendance] = list(
-            Attendance.objects.filter(student=student).order_by('-date_time')
+            Attendance.objects.filter(student=student).only(
+                'status', 'date_time'
+            ).order_by('-date_time')[:7]
         )
         
-        total_present: int = sum(1 for att in attendance_records if att.status == 'Present')
-        total_absent: int = sum(1 for att in attendance_records if att.status == 'Absent')
-        total_late: int = sum(1 for att in attendance_records if att.status == 'Late')
+        # Status counts for the whole class roster, grouped in SQL so one
+        # row per classmate reaches Python (zeros for students without records)
+        class_counts: Dict[int, tuple[int, int, int]] = {
+            classmate_id: (present, absent, late)
+            for classmate_id, present, absent, late in Student.objects.filter(
+                student_class=student_class
+            ).annotate(
+                present=Count('attendance', filter=Q(attendance__status=Attendance.PRESENT)),
+                absent=Count('attendance', filter=Q(attendance__status=Attendance.ABSENT)),
+                late=Count('attendance', filter=Q(attendance__status=Attendance.LATE)),
+            ).order_by('user_id').values_list('user_id', 'present', 'absent', 'late')
+        }
+        
+        total_present, total_absent, total_late = class_counts.get(
+            student.user_id, (0, 0, 0)
+        )
         total_days: int = total_present + total_absent + total_late
         
         overall_percentage: float = (
@@ -304,32 +386,23 @@ class StudentDashboardView(APIView):
             {
                 "date": att.date_time.strftime("%Y-%m-%d"),
                 "attendance": (
-                    1 if att.status == 'Present' 
-                    else (0.5 if att.status == 'Late' else 0)
+                    1 if att.status == Attendance.PRESENT 
+                    else (0.5 if att.status == Attendance.LATE else 0)
                 ),
             }
             for att in attendance_records[:7]
         ]
         
-        classmates: List[Student] = list(
-            Student.objects.filter(student_class_id=student_class)
-        )
-        total_classmates: int = len(classmates)
+        total_classmates: int = len(class_counts)
         
         classmate_attendance: List[tuple[int, float]] = []
-        for classmate in classmates:
-            classmate_records: List[Attendance] = list(
-                Attendance.objects.filter(student=classmate)
-            )
-            classmate_present: int = sum(1 for att in classmate_records if att.status == 'Present')
-            classmate_absent: int = sum(1 for att in classmate_records if att.status == 'Absent')
-            classmate_late: int = sum(1 for att in classmate_records if att.status == 'Late')
+        for classmate_id, (classmate_present, classmate_absent, classmate_late) in class_counts.items():
             classmate_total_days: int = classmate_present + classmate_absent + classmate_late
             classmate_percentage: float = (
                 (classmate_present / classmate_total_days) * 100 
                 if classmate_total_days > 0 else 0
             )
-            classmate_attendance.append((classmate.user_id, classmate_percentage))
+            classmate_attendance.append((classmate_id, classmate_percentage))
         
         classmate_attendance.sort(key=lambda x: x[1], reverse=True)
         
@@ -354,7 +427,7 @@ class StudentDashboardView(APIView):
         )
         
         data: Dict[str, Any] = {
-            "id": student.user.id,
+            "id": student.user_id,
             "first_name": student.first_name,
             "middle_name": student.middle_name if student.middle_name else "",
             "last_name": student.last_name,
@@ -649,7 +722,8 @@ class AdminListCreateView(APIView):
         Returns:
             Response with list of admins.
         """
-        admins: List[Admin] = list(Admin.objects.all())
+        # The serializer nests user and role, so join them in the same query
+        admins: List[Admin] = list(Admin.objects.select_related('user', 'role'))
         serializer: AdminSerializer = AdminSerializer(admins, many=True)
         return Response(serializer.data)
     
@@ -932,7 +1006,7 @@ class AttendanceMarkView(APIView):
             Response with created attendance data.
         """
         student_id: int | None = request.data.get('student_id')
-        status_value: str = request.data.get('status', 'Present')
+        status_value: str = request.data.get('status', Attendance.PRESENT)
         
         if not student_id:
             return Response(
@@ -0,0 +1,16 @@
+"""
+Celery application for the attendance_system project.
+
+Tasks are discovered from each installed app's ``tasks`` module and read
+their configuration from the ``CELERY_*`` Django settings.
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'attendance_system.settings')
+
+app: Celery = Celery('attendance_system')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
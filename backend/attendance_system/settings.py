@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -64,6 +65,13 @@ MIDDLEWARE = [
 #       ],
 # }
 
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+}
+
 # SIMPLE_JWT = {
 #      'ACCESS_TOKEN_LIFETIME': timedelta(minutes=10),
 #      'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
@@ -95,14 +103,30 @@ WSGI_APPLICATION = 'attendance_system.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# Connections are kept open for CONN_MAX_AGE seconds and reused across
+# requests under WSGI; CONN_HEALTH_CHECKS replaces a dead connection before
+# use. Under ASGI, set CONN_MAX_AGE to 0 and pool outside Django (pgbouncer).
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
 
+# Password hashing
+# https://docs.djangoproject.com/en/5.1/topics/auth/passwords/#using-argon2-with-django
+
+PASSWORD_HASHERS = [
+    'api.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -148,6 +172,50 @@ AUTH_USER_MODEL = 'api.User'
 CORS_ORIGIN_ALLOW_ALL = True
 CORS_ALLOW_CREDENTIALS = True
 
+# Signing key and algorithm for the 'jwt' auth cookie
+JWT_SECRET = 'secret'
+JWT_ALGORITHM = 'HS256'
+
+# Shared cache for per-token UserView payloads, list ETags and dashboard
+# aggregates. Set CACHE_REDIS_URL in deployments: Redis (already required by
+# Celery) keeps entries and their signal-driven invalidation consistent
+# across worker processes. Without it (dev, CI) each process falls back to
+# its own locmem cache.
+CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL')
+if CACHE_REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# List endpoint ETags are tokens in the cache that writes delete. A per-process
+# locmem cache would keep answering 304 from workers that never saw the delete,
+# so conditional GETs on those lists are only served with the shared cache.
+LIST_ETAGS_ENABLED = bool(CACHE_REDIS_URL)
+
+# Celery (background tasks such as bulk registration)
+CELERY_BROKER_URL = 'redis://localhost:6379/0'
+CELERY_RESULT_BACKEND = 'redis://localhost:6379/0'
+CELERY_TASK_SERIALIZER = 'json'
+CELERY_RESULT_SERIALIZER = 'json'
+CELERY_ACCEPT_CONTENT = ['json']
+
+# Refresh the cached attendance trend more often than its 60s cache timeout
+CELERY_BEAT_SCHEDULE = {
+    'refresh-attendance-trend': {
+        'task': 'admin_app.tasks.refresh_attendance_trend',
+        'schedule': 30.0,
+    },
+}
+
 CRONJOBS = [
     ('0 16 * * *', 'django.core.management.call_command', ['mark_absent'], '>> C:/Users/sahan/one_dr_file/Documents/clg_prj/backend/cronjob.log 2>&1'),
 ]